@@ -1,9 +1,81 @@
 import os
 import json
 import configparser
+import copy
+import functools
 import logging
+import threading
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    _json_loads = json.loads
+
+# Environment overrides, read once at import time
+_ENV_SNS_TOPIC_ARN = os.environ.get('SNS_TOPIC_ARN')
+_ENV_AWS_REGION = os.environ.get('AWS_DEFAULT_REGION')
+_ENV_AWS_ACCOUNTS = os.environ.get('AWS_ACCOUNTS')
+# Only write default config/accounts files when explicitly asked to, since
+# deployed configs are mounted and the filesystem may be read-only
+_ENV_WRITE_DEFAULTS = os.environ.get('ATIS_WRITE_DEFAULTS')
+
+# Parsed config.ini / accounts.json contents keyed by (path, mtime, size) so
+# that repeated ConfigManager instances in one process skip unchanged files.
+# Every instance gets its own copy, so one caller's changes never leak into
+# another's, and the lock keeps concurrent loads from parsing the same file twice.
+_CONFIG_CACHE = {}
+_ACCOUNTS_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+def _file_cache_key(path):
+    """Build a cache key that changes whenever the file is modified.
+    
+    Args:
+        path (str): Path to the file
+        
+    Returns:
+        tuple: (absolute path, mtime in ns, size in bytes)
+    """
+    st = os.stat(path)
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+def _section_values(config, section):
+    """Copy a config section into a dict, interpolating each value once.
+    
+    Args:
+        config (configparser.ConfigParser): Parsed configuration
+        section (str): Section name
+        
+    Returns:
+        dict: Section options
+    """
+    values = {}
+    for key, raw_value in config.items(section, raw=True):
+        try:
+            values[key] = config.get(section, key)
+        except configparser.InterpolationError:
+            # A literal '%' (e.g. in a log file pattern) is not valid
+            # interpolation syntax; keep the value as written rather than
+            # failing the whole load
+            values[key] = raw_value
+    return values
+
+def _snapshot(config):
+    """Copy every config section into a plain dict.
+    
+    Getters read the snapshot to avoid ConfigParser's per-call lookup and
+    interpolation machinery.
+    
+    Args:
+        config (configparser.ConfigParser): Parsed configuration
+        
+    Returns:
+        dict: Section name to section options
+    """
+    return {section: _section_values(config, section) for section in config.sections()}
+
 class ConfigurationError(Exception):
     """Exception raised for configuration errors."""
     pass
@@ -21,37 +93,55 @@ class ConfigManager:
         self.logger = logging.getLogger(__name__)
         self.config_file = config_file
         self.accounts_file = accounts_file
-        self.config = None
-        self.accounts = []
-        self.load_config()
-        self.load_accounts()
+        # Loaded lazily on first access so code paths that never read the
+        # config or the account list skip the file I/O and parsing
+        self._config = None
+        self._snapshot = {}
+        self._accounts = None
+        
+    @property
+    def config(self):
+        """ConfigParser: Parsed configuration, loaded on first access."""
+        if self._config is None:
+            self.load_config()
+        return self._config
+        
+    @property
+    def accounts(self):
+        """list: Account dictionaries, loaded on first access."""
+        if self._accounts is None:
+            self.load_accounts()
+        return self._accounts
         
     def load_config(self):
         """Load configuration from config file."""
+        # Drop values memoized from a previous load
+        for name in ('_tag_config', '_log_config', '_rds_config', 'sns_topic_arn'):
+            self.__dict__.pop(name, None)
+            
         try:
-            self.config = configparser.ConfigParser()
+            self._config = configparser.ConfigParser()
             
-            # Check if config file exists, if not create with defaults
+            # Check if config file exists, if not fall back to defaults
             if not Path(self.config_file).exists():
-                self.logger.warning(f"Config file {self.config_file} not found, creating with defaults")
-                os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+                self.logger.warning(f"Config file {self.config_file} not found, using defaults")
                 
-                self.config['aws'] = {
+                self._config['aws'] = {
                     'region': 'ap-southeast-2',
                     'tag_key': 'Schedule',
                     'tag_value': 'enabled'
                 }
                 
-                self.config['sns'] = {
-                    'topic_arn': os.environ.get('SNS_TOPIC_ARN', '')
+                self._config['sns'] = {
+                    'topic_arn': _ENV_SNS_TOPIC_ARN or ''
                 }
                 
-                self.config['logging'] = {
+                self._config['logging'] = {
                     'level': 'INFO',
                     'file': 'rds-scheduler.log'
                 }
                 
-                self.config['rds'] = {
+                self._config['rds'] = {
                     'engine_filter': 'aurora-postgresql',
                     'cluster_verification_timeout': '600',
                     'instance_verification_timeout': '300',
@@ -59,10 +149,21 @@ class ConfigManager:
                     'instance_check_interval': '15'
                 }
                 
-                with open(self.config_file, 'w') as f:
-                    self.config.write(f)
+                if _ENV_WRITE_DEFAULTS:
+                    self.logger.info(f"Writing default config to {self.config_file}")
+                    os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+                    with open(self.config_file, 'w') as f:
+                        self._config.write(f)
+                
+                self._snapshot = _snapshot(self._config)
             else:
-                self.config.read(self.config_file)
+                cache_key = _file_cache_key(self.config_file)
+                with _CACHE_LOCK:
+                    cached = _CONFIG_CACHE.get(cache_key)
+                    if cached is None:
+                        self._config.read_string(Path(self.config_file).read_text(encoding='utf-8'), source=self.config_file)
+                        cached = _CONFIG_CACHE[cache_key] = (self._config, _snapshot(self._config))
+                self._config, self._snapshot = copy.deepcopy(cached)
                 
         except Exception as e:
             self.logger.error(f"Failed to load configuration: {str(e)}")
@@ -72,19 +173,18 @@ class ConfigManager:
         """Load accounts from accounts file or environment."""
         try:
             # First check if accounts are provided in environment
-            accounts_env = os.environ.get('AWS_ACCOUNTS')
+            accounts_env = _ENV_AWS_ACCOUNTS
             if accounts_env:
                 try:
-                    self.accounts = json.loads(accounts_env)
-                    self.logger.info(f"Loaded {len(self.accounts)} accounts from environment")
+                    self._accounts = _json_loads(accounts_env)
+                    self.logger.info(f"Loaded {len(self._accounts)} accounts from environment")
                     return
                 except json.JSONDecodeError:
                     self.logger.warning("Failed to parse AWS_ACCOUNTS environment variable, falling back to file")
             
-            # Check if accounts file exists, if not create with placeholder
+            # Check if accounts file exists, if not fall back to placeholder
             if not Path(self.accounts_file).exists():
-                self.logger.warning(f"Accounts file {self.accounts_file} not found, creating placeholder")
-                os.makedirs(os.path.dirname(self.accounts_file), exist_ok=True)
+                self.logger.warning(f"Accounts file {self.accounts_file} not found, using placeholder")
                 
                 placeholder_accounts = {
                     "accounts": [
@@ -103,15 +203,23 @@ class ConfigManager:
                     ]
                 }
                 
-                with open(self.accounts_file, 'w') as f:
-                    json.dump(placeholder_accounts, f, indent=2)
+                if _ENV_WRITE_DEFAULTS:
+                    self.logger.info(f"Writing placeholder accounts to {self.accounts_file}")
+                    os.makedirs(os.path.dirname(self.accounts_file), exist_ok=True)
+                    with open(self.accounts_file, 'w') as f:
+                        json.dump(placeholder_accounts, f, indent=2)
                     
-                self.accounts = placeholder_accounts['accounts']
+                self._accounts = placeholder_accounts['accounts']
             else:
-                with open(self.accounts_file, 'r') as f:
-                    self.accounts = json.load(f).get('accounts', [])
+                cache_key = _file_cache_key(self.accounts_file)
+                with _CACHE_LOCK:
+                    cached = _ACCOUNTS_CACHE.get(cache_key)
+                    if cached is None:
+                        cached = _json_loads(Path(self.accounts_file).read_bytes()).get('accounts', [])
+                        _ACCOUNTS_CACHE[cache_key] = cached
+                self._accounts = copy.deepcopy(cached)
                     
-            self.logger.info(f"Loaded {len(self.accounts)} accounts from file")
+            self.logger.info(f"Loaded {len(self._accounts)} accounts from file")
                 
         except Exception as e:
             self.logger.error(f"Failed to load accounts: {str(e)}")
@@ -124,16 +232,29 @@ class ConfigManager:
             account_names (list): Optional list of account names to filter by
             
         Returns:
-            list: List of account dictionaries
+            list: Copies of the account dictionaries, safe for the caller to modify
         """
         if not account_names:
-            return self.accounts
+            return [dict(acc) for acc in self.accounts]
             
-        filtered_accounts = [acc for acc in self.accounts if acc['name'] in account_names]
+        filtered_accounts = [dict(acc) for acc in self.accounts if acc['name'] in account_names]
         if not filtered_accounts:
             self.logger.warning(f"No accounts found matching {account_names}")
         return filtered_accounts
         
+    def _section(self, name):
+        """Get a configuration section as a plain dict.
+        
+        Args:
+            name (str): Configuration section
+            
+        Returns:
+            dict: Section options, empty if the section is missing
+        """
+        if self._config is None:
+            self.load_config()
+        return self._snapshot.get(name, {})
+        
     def get_region(self, region=None):
         """Get the AWS region to use.
         
@@ -146,22 +267,31 @@ class ConfigManager:
         if region:
             return region
             
-        env_region = os.environ.get('AWS_DEFAULT_REGION')
+        env_region = _ENV_AWS_REGION
         if env_region:
             return env_region
             
-        config_region = self.config.get('aws', 'region', fallback='ap-southeast-2')
+        config_region = self._section('aws').get('region', 'ap-southeast-2')
         return config_region
         
+    @functools.cached_property
+    def _tag_config(self):
+        aws = self._section('aws')
+        return aws.get('tag_key', 'Schedule'), aws.get('tag_value', 'enabled')
+        
     def get_tag_config(self):
         """Get the tag configuration.
         
         Returns:
             tuple: (tag_key, tag_value)
         """
-        tag_key = self.config.get('aws', 'tag_key', fallback='Schedule')
-        tag_value = self.config.get('aws', 'tag_value', fallback='enabled')
-        return tag_key, tag_value
+        return self._tag_config
+        
+    @functools.cached_property
+    def sns_topic_arn(self):
+        """str: SNS topic ARN, from the environment or else the config."""
+        # The environment override needs no config load at all
+        return _ENV_SNS_TOPIC_ARN or self._section('sns').get('topic_arn')
         
     def get_sns_topic_arn(self):
         """Get the SNS topic ARN.
@@ -169,13 +299,15 @@ class ConfigManager:
         Returns:
             str: SNS topic ARN
         """
-        # First check environment
-        sns_arn = os.environ.get('SNS_TOPIC_ARN')
-        if sns_arn:
-            return sns_arn
-            
-        # Then check config
-        return self.config.get('sns', 'topic_arn', fallback=None)
+        return self.sns_topic_arn
+        
+    @functools.cached_property
+    def _log_config(self):
+        logging_config = self._section('logging')
+        return {
+            'level': logging_config.get('level', 'INFO'),
+            'file': logging_config.get('file', 'rds-scheduler.log')
+        }
         
     def get_log_config(self):
         """Get logging configuration.
@@ -183,9 +315,19 @@ class ConfigManager:
         Returns:
             dict: Logging configuration
         """
+        return self._log_config
+        
+    @functools.cached_property
+    def _rds_config(self):
+        # Converted on first use only, so a malformed value here cannot stop
+        # the rest of the configuration from loading
+        rds = self._section('rds')
         return {
-            'level': self.config.get('logging', 'level', fallback='INFO'),
-            'file': self.config.get('logging', 'file', fallback='rds-scheduler.log')
+            'engine_filter': rds.get('engine_filter', 'aurora-postgresql'),
+            'cluster_verification_timeout': int(rds.get('cluster_verification_timeout', 600)),
+            'instance_verification_timeout': int(rds.get('instance_verification_timeout', 300)),
+            'cluster_check_interval': int(rds.get('cluster_check_interval', 30)),
+            'instance_check_interval': int(rds.get('instance_check_interval', 15))
         }
         
     def get_rds_config(self):
@@ -194,13 +336,7 @@ class ConfigManager:
         Returns:
             dict: RDS configuration
         """
-        return {
-            'engine_filter': self.config.get('rds', 'engine_filter', fallback='aurora-postgresql'),
-            'cluster_verification_timeout': self.config.getint('rds', 'cluster_verification_timeout', fallback=600),
-            'instance_verification_timeout': self.config.getint('rds', 'instance_verification_timeout', fallback=300),
-            'cluster_check_interval': self.config.getint('rds', 'cluster_check_interval', fallback=30),
-            'instance_check_interval': self.config.getint('rds', 'instance_check_interval', fallback=15)
-        }
+        return self._rds_config
 
     def get(self, section, key, fallback=None):
         """Get a configuration value.
@@ -213,4 +349,5 @@ class ConfigManager:
         Returns:
             Configuration value
         """
-        return self.config.get(section, key, fallback=fallback) 
\ No newline at end of file
+        # Option names are stored lowercased by ConfigParser
+        return self._section(section).get(self._config.optionxform(key), fallback) 
\ No newline at end of file
@@ -2,13 +2,51 @@ import argparse
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
 from datetime import datetime
+from operator import itemgetter
 
 from config_manager import ConfigManager
-from rds_operations import RDSOperations, RDSOperationError
+from rds_operations import RDSOperations, RDSOperationError, MAX_POOL_CONNECTIONS, TAG_LOOKUP_WORKERS, ACTION_WORKERS
 from reporting import Reporter, ReportingError
 from sns_notifier import SNSNotifier
 
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config')
+CONFIG_FILE = os.path.join(CONFIG_DIR, 'config.ini')
+ACCOUNTS_FILE = os.path.join(CONFIG_DIR, 'accounts.json')
+
+# Upper bound on accounts processed concurrently. Accounts in one region share
+# its RDSOperations clients, so their per-account tag lookup and start/stop
+# pools are scaled down to keep at most MAX_POOL_CONNECTIONS calls in flight
+MAX_ACCOUNT_WORKERS = 16
+
+# Per resource kind: identifier getter, report/log labels, action table
+# (action -> (RDSOperations method, state expected after the action)) and
+# the RDSOperations method used to verify that state
+RESOURCE_DEFINITIONS = {
+    'cluster': {
+        'get_id': itemgetter('DBClusterIdentifier'),
+        'resource_type': 'Aurora Cluster',
+        'label': 'Aurora clusters',
+        'actions': {
+            'start': ('start_clusters', 'available'),
+            'stop': ('stop_clusters', 'stopped')
+        },
+        'verify': 'verify_cluster_states'
+    },
+    'instance': {
+        'get_id': itemgetter('DBInstanceIdentifier'),
+        'resource_type': 'RDS Instance',
+        'label': 'RDS instances',
+        'actions': {
+            'start': ('start_instances', 'available'),
+            'stop': ('stop_instances', 'stopped')
+        },
+        'verify': 'verify_instance_states'
+    }
+}
+
 def setup_logging(log_level='INFO', log_file=None):
     """Set up logging.
     
@@ -20,24 +58,18 @@ def setup_logging(log_level='INFO', log_file=None):
     if not isinstance(numeric_level, int):
         numeric_level = logging.INFO
         
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(numeric_level)
-    
-    # Set up console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(numeric_level)
-    console_format = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    console_handler.setFormatter(console_format)
-    root_logger.addHandler(console_handler)
-    
-    # Set up file handler if log file provided
+    # Console handler plus optional file handler; force=True replaces any
+    # handlers left from a previous call instead of attaching duplicates
+    handlers = [logging.StreamHandler()]
     if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(numeric_level)
-        file_format = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(file_format)
-        root_logger.addHandler(file_handler)
+        handlers.append(logging.FileHandler(log_file))
+        
+    logging.basicConfig(
+        level=numeric_level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=handlers,
+        force=True
+    )
 
 def parse_args():
     """Parse command line arguments.
@@ -61,12 +93,13 @@ def parse_args():
     
     return parser.parse_args()
 
-def process_aurora_clusters(rds_ops, clusters, action, args, account, region, reporter):
-    """Process Aurora PostgreSQL clusters.
+def process_resources(rds_ops, resources, kind, action, args, account, region, reporter):
+    """Run an action on Aurora clusters or RDS instances and record the results.
     
     Args:
         rds_ops: RDSOperations instance
-        clusters: List of clusters to process
+        resources: List of clusters or instances to process
+        kind: Resource kind, a key of RESOURCE_DEFINITIONS
         action: Action to perform (start/stop)
         args: Command line arguments
         account: Account information
@@ -74,92 +107,121 @@ def process_aurora_clusters(rds_ops, clusters, action, args, account, region, re
         reporter: Reporter instance
         
     Returns:
-        int: Number of clusters processed
+        int: Number of resources processed
     """
     logger = logging.getLogger(__name__)
     account_name = account['name'] if account else 'default'
+    definition = RESOURCE_DEFINITIONS[kind]
+    label = definition['label']
     
-    if not clusters:
-        logger.info(f"No Aurora clusters found in account {account_name}")
+    if not resources:
+        logger.info(f"No {label} found in account {account_name}")
         return 0
     
-    cluster_ids = [cluster['DBClusterIdentifier'] for cluster in clusters]
-    logger.info(f"Processing {len(cluster_ids)} Aurora clusters in account {account_name}: {cluster_ids}")
+    get_id = definition['get_id']
+    resource_type = definition['resource_type']
+    resource_ids = list(map(get_id, resources))
+    logger.info(f"Processing {len(resource_ids)} {label} in account {account_name}")
+    logger.debug("%s in account %s: %s", label, account_name, resource_ids)
     
     # Execute the requested action (dry-run is handled in RDSOperations)
     if not args.notify_only:
-        if action == 'start':
-            results = rds_ops.start_clusters(cluster_ids)
-        else:  # stop
-            results = rds_ops.stop_clusters(cluster_ids)
+        method_name, expected_state = definition['actions'][action]
+        results = getattr(rds_ops, method_name)(resource_ids)
         
-        # Process results and add to reporter
-        for result in results['succeeded']:
-            reporter.add_result(
-                account=account_name,
-                region=region,
-                resource_type='Aurora Cluster',
-                resource_id=result['DBClusterIdentifier'],
-                previous_state=result.get('PreviousStatus', 'unknown'),
-                new_state=result.get('CurrentStatus', 'unknown'),
-                action=action,
-                timestamp=result['Timestamp'],
-                status=result['Status'],
-                error=None
-            )
-        
-        for result in results['failed']:
-            reporter.add_result(
-                account=account_name,
-                region=region,
-                resource_type='Aurora Cluster',
-                resource_id=result['DBClusterIdentifier'],
-                previous_state='unknown',
-                new_state='error',
-                action=action,
-                timestamp=result['Timestamp'],
-                status=result['Status'],
-                error=result.get('Error')
-            )
+        # Add action results to reporter in a single batch
+        reporter.extend_results([
+            {
+                'Account': account_name,
+                'Region': region,
+                'ResourceType': resource_type,
+                'ResourceId': get_id(result),
+                'PreviousState': result.get('PreviousStatus', 'unknown'),
+                'NewState': result.get('CurrentStatus', 'unknown'),
+                'Action': action,
+                'Timestamp': result['Timestamp'],
+                'Status': result['Status'],
+                'Error': ''
+            }
+            for result in results['succeeded']
+        ] + [
+            {
+                'Account': account_name,
+                'Region': region,
+                'ResourceType': resource_type,
+                'ResourceId': get_id(result),
+                'PreviousState': 'unknown',
+                'NewState': 'error',
+                'Action': action,
+                'Timestamp': result['Timestamp'],
+                'Status': result['Status'],
+                'Error': f"{result['ErrorCode']}: {result['Error']}"
+            }
+            for result in results['failed']
+        ])
         
         # Verify states if requested
         if args.verify and results['succeeded']:
-            expected_state = 'available' if action == 'start' else 'stopped'
-            succeeded_cluster_ids = [r['DBClusterIdentifier'] for r in results['succeeded']]
-            
-            logger.info(f"Verifying cluster states, expecting: {expected_state}")
-            verification_results = rds_ops.verify_cluster_states(succeeded_cluster_ids, expected_state)
+            # Every requested ID lands in succeeded or failed, so reuse the
+            # requested IDs when nothing failed
+            if results['failed']:
+                succeeded_ids = list(map(get_id, results['succeeded']))
+            else:
+                succeeded_ids = resource_ids
             
-            # Add verification results to reporter
-            for result in verification_results['verified']:
-                reporter.add_result(
-                    account=account_name,
-                    region=region,
-                    resource_type='Aurora Cluster',
-                    resource_id=result['DBClusterIdentifier'],
-                    previous_state='transitioning',
-                    new_state=result['CurrentStatus'],
-                    action=f'{action}_verify',
-                    timestamp=result['Timestamp'],
-                    status='Verified',
-                    error=None
-                )
+            logger.info(f"Verifying {kind} states, expecting: {expected_state}")
+            verification_results = getattr(rds_ops, definition['verify'])(succeeded_ids, expected_state)
+            verify_action = f'{action}_verify'
             
-            for result in verification_results['failed']:
-                reporter.add_result(
-                    account=account_name,
-                    region=region,
-                    resource_type='Aurora Cluster',
-                    resource_id=result['DBClusterIdentifier'],
-                    previous_state='transitioning',
-                    new_state='verification_failed',
-                    action=f'{action}_verify',
-                    timestamp=result['Timestamp'],
-                    status='Failed',
-                    error=result.get('Error')
-                )
+            # Add verification results to reporter in a single batch
+            reporter.extend_results([
+                {
+                    'Account': account_name,
+                    'Region': region,
+                    'ResourceType': resource_type,
+                    'ResourceId': get_id(result),
+                    'PreviousState': 'transitioning',
+                    'NewState': result['CurrentStatus'],
+                    'Action': verify_action,
+                    'Timestamp': result['Timestamp'],
+                    'Status': 'Verified',
+                    'Error': ''
+                }
+                for result in verification_results['verified']
+            ] + [
+                {
+                    'Account': account_name,
+                    'Region': region,
+                    'ResourceType': resource_type,
+                    'ResourceId': get_id(result),
+                    'PreviousState': 'transitioning',
+                    'NewState': 'verification_failed',
+                    'Action': verify_action,
+                    'Timestamp': result['Timestamp'],
+                    'Status': 'Failed',
+                    'Error': result.get('Error') or ''
+                }
+                for result in verification_results['failed']
+            ])
+    
+    return len(resources)
+
+def process_aurora_clusters(rds_ops, clusters, action, args, account, region, reporter):
+    """Process Aurora PostgreSQL clusters.
     
-    return len(clusters)
+    Args:
+        rds_ops: RDSOperations instance
+        clusters: List of clusters to process
+        action: Action to perform (start/stop)
+        args: Command line arguments
+        account: Account information
+        region: AWS region
+        reporter: Reporter instance
+        
+    Returns:
+        int: Number of clusters processed
+    """
+    return process_resources(rds_ops, clusters, 'cluster', action, args, account, region, reporter)
 
 def process_rds_instances(rds_ops, instances, action, args, account, region, reporter):
     """Process standalone RDS instances.
@@ -176,90 +238,49 @@ def process_rds_instances(rds_ops, instances, action, args, account, region, rep
     Returns:
         int: Number of instances processed
     """
+    return process_resources(rds_ops, instances, 'instance', action, args, account, region, reporter)
+
+def process_account(rds_ops, account, args, tag_key, tag_value, region, reporter, do_clusters, do_instances):
+    """Process the Aurora clusters and RDS instances of a single account.
+    
+    Args:
+        rds_ops: RDSOperations instance for the account region
+        account: Account information
+        args: Command line arguments
+        tag_key: Tag key to filter resources
+        tag_value: Tag value to filter resources
+        region: AWS region of the account
+        reporter: Reporter instance
+        do_clusters: Whether to process Aurora clusters
+        do_instances: Whether to process standalone RDS instances
+        
+    Returns:
+        int: Number of resources processed
+    """
     logger = logging.getLogger(__name__)
-    account_name = account['name'] if account else 'default'
+    logger.info(f"Processing account: {account['name']} in region: {region}")
     
-    if not instances:
-        logger.info(f"No RDS instances found in account {account_name}")
-        return 0
+    processed = 0
     
-    instance_ids = [instance['DBInstanceIdentifier'] for instance in instances]
-    logger.info(f"Processing {len(instance_ids)} RDS instances in account {account_name}: {instance_ids}")
+    # Process Aurora clusters
+    if do_clusters:
+        try:
+            clusters = rds_ops.find_tagged_clusters(tag_key, tag_value)
+            processed += process_aurora_clusters(rds_ops, clusters, args.action, args, account, region, reporter)
+        except RDSOperationError as e:
+            logger.error(f"Error processing Aurora clusters in account {account['name']}: {str(e)}")
+            return processed
     
-    # Execute the requested action (dry-run is handled in RDSOperations)
-    if not args.notify_only:
-        if action == 'start':
-            results = rds_ops.start_instances(instance_ids)
-        else:  # stop
-            results = rds_ops.stop_instances(instance_ids)
-        
-        # Process results and add to reporter
-        for result in results['succeeded']:
-            reporter.add_result(
-                account=account_name,
-                region=region,
-                resource_type='RDS Instance',
-                resource_id=result['DBInstanceIdentifier'],
-                previous_state=result.get('PreviousStatus', 'unknown'),
-                new_state=result.get('CurrentStatus', 'unknown'),
-                action=action,
-                timestamp=result['Timestamp'],
-                status=result['Status'],
-                error=None
-            )
-        
-        for result in results['failed']:
-            reporter.add_result(
-                account=account_name,
-                region=region,
-                resource_type='RDS Instance',
-                resource_id=result['DBInstanceIdentifier'],
-                previous_state='unknown',
-                new_state='error',
-                action=action,
-                timestamp=result['Timestamp'],
-                status=result['Status'],
-                error=result.get('Error')
-            )
-        
-        # Verify states if requested
-        if args.verify and results['succeeded']:
-            expected_state = 'available' if action == 'start' else 'stopped'
-            succeeded_instance_ids = [r['DBInstanceIdentifier'] for r in results['succeeded']]
-            
-            logger.info(f"Verifying instance states, expecting: {expected_state}")
-            verification_results = rds_ops.verify_instance_states(succeeded_instance_ids, expected_state)
-            
-            # Add verification results to reporter
-            for result in verification_results['verified']:
-                reporter.add_result(
-                    account=account_name,
-                    region=region,
-                    resource_type='RDS Instance',
-                    resource_id=result['DBInstanceIdentifier'],
-                    previous_state='transitioning',
-                    new_state=result['CurrentStatus'],
-                    action=f'{action}_verify',
-                    timestamp=result['Timestamp'],
-                    status='Verified',
-                    error=None
-                )
-            
-            for result in verification_results['failed']:
-                reporter.add_result(
-                    account=account_name,
-                    region=region,
-                    resource_type='RDS Instance',
-                    resource_id=result['DBInstanceIdentifier'],
-                    previous_state='transitioning',
-                    new_state='verification_failed',
-                    action=f'{action}_verify',
-                    timestamp=result['Timestamp'],
-                    status='Failed',
-                    error=result.get('Error')
-                )
+    # Process standalone RDS instances
+    if do_instances:
+        try:
+            instances = rds_ops.find_tagged_instances(tag_key, tag_value)
+            processed += process_rds_instances(rds_ops, instances, args.action, args, account, region, reporter)
+        except RDSOperationError as e:
+            logger.error(f"Error processing RDS instances in account {account['name']}: {str(e)}")
+            return processed
     
-    return len(instances)
+    return processed
 
 def main():
     """Main entry point."""
@@ -268,10 +289,7 @@ def main():
         args = parse_args()
         
         # Load configuration with proper paths
-        config_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'config.ini')
-        accounts_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'accounts.json')
-        
-        config_manager = ConfigManager(config_file, accounts_file)
+        config_manager = ConfigManager(CONFIG_FILE, ACCOUNTS_FILE)
         
         # Set up logging with enhanced config
         log_config = config_manager.get_log_config()
@@ -293,8 +311,11 @@ def main():
         
         logger.info(f"Using region: {region}, tag filter: {tag_key}={tag_value}")
         
+        # Resolve the target selection once rather than per account
+        do_clusters = args.target in ('clusters', 'both')
+        do_instances = args.target in ('instances', 'both')
+        
         # Initialize components
-        rds_ops = RDSOperations(region, dry_run=args.dry_run)
         reporter = Reporter()
         
         # Get accounts to process using enhanced method
@@ -307,47 +328,51 @@ def main():
             logger.error(f"No accounts found to process")
             return 1
         
-        total_processed = 0
+        # Build RDS operations once per region up front so worker threads
+        # only ever read the mapping
+        rds_ops_by_region = {}
+        accounts_by_region = Counter(account.get('region', region) for account in accounts)
+        for account_region, account_count in accounts_by_region.items():
+            # Split the region's connection pool between the accounts that can run at once
+            workers = max(1, MAX_POOL_CONNECTIONS // min(MAX_ACCOUNT_WORKERS, account_count))
+            rds_ops_by_region[account_region] = RDSOperations(account_region, dry_run=args.dry_run,
+                                                              tag_workers=min(TAG_LOOKUP_WORKERS, workers),
+                                                              action_workers=min(ACTION_WORKERS, workers))
         
-        # Process each account
-        for account in accounts:
-            account_region = account.get('region', region)
-            logger.info(f"Processing account: {account['name']} in region: {account_region}")
-            
-            # Update RDS operations for account region if different
-            if account_region != region:
-                rds_ops = RDSOperations(account_region, dry_run=args.dry_run)
-            
-            # Process Aurora clusters
-            if args.target in ['clusters', 'both']:
-                try:
-                    clusters = rds_ops.find_tagged_clusters(tag_key, tag_value)
-                    processed = process_aurora_clusters(rds_ops, clusters, args.action, args, account, account_region, reporter)
-                    total_processed += processed
-                except RDSOperationError as e:
-                    logger.error(f"Error processing Aurora clusters in account {account['name']}: {str(e)}")
-                    continue
+        # Accounts are independent and network-bound, so process them concurrently
+        max_workers = min(MAX_ACCOUNT_WORKERS, len(accounts))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for account in accounts:
+                account_region = account.get('region', region)
+                futures.append((account, executor.submit(process_account, rds_ops_by_region[account_region],
+                                                         account, args, tag_key, tag_value, account_region,
+                                                         reporter, do_clusters, do_instances)))
             
-            # Process standalone RDS instances
-            if args.target in ['instances', 'both']:
+            # An unexpected error in one account must not discard the work
+            # already done in the others, so collect each account separately
+            total_processed = 0
+            failed_accounts = []
+            for account, future in futures:
                 try:
-                    instances = rds_ops.find_tagged_instances(tag_key, tag_value)
-                    processed = process_rds_instances(rds_ops, instances, args.action, args, account, account_region, reporter)
-                    total_processed += processed
-                except RDSOperationError as e:
-                    logger.error(f"Error processing RDS instances in account {account['name']}: {str(e)}")
-                    continue
+                    total_processed += future.result()
+                except Exception as e:
+                    logger.error(f"Unexpected error processing account {account['name']}: {str(e)}")
+                    failed_accounts.append(account['name'])
         
         logger.info(f"Total resources processed: {total_processed}")
+        if failed_accounts:
+            logger.error(f"Failed accounts: {', '.join(failed_accounts)}")
         
         # Generate reports
-        if reporter.results:
+        if reporter.result_count:
             logger.info("Generating reports")
             
-            csv_report = reporter.generate_csv_report()
-            json_report = reporter.generate_json_report()
-            table_report = reporter.generate_table_report()
-            html_report = reporter.generate_html_report()
+            reports = reporter.generate_all_reports()
+            csv_report = reports['csv']
+            json_report = reports['json']
+            table_report = reports['table']
+            html_report = reports['html']
             
             logger.info(f"Reports generated: {csv_report}, {json_report}, {html_report}")
             
@@ -359,6 +384,8 @@ def main():
                     
                     # Generate summary for notification
                     summary = f"RDS Scheduler completed for {args.target}.\nTotal resources processed: {total_processed}"
+                    if failed_accounts:
+                        summary += f"\nFailed accounts: {', '.join(failed_accounts)}"
                     if args.dry_run:
                         summary += "\n[DRY RUN] No actual changes were made."
                     
@@ -381,6 +408,10 @@ def main():
                 logger.warning("No SNS topic ARN configured, skipping notification")
         else:
             logger.info("No resources processed, no reports generated")
+        
+        if failed_accounts:
+            logger.error(f"RDS Scheduler completed with {len(failed_accounts)} failed account(s)")
+            return 1
             
         logger.info("RDS Scheduler completed successfully")
         return 0
@@ -390,9 +421,7 @@ def main():
         
         # Try to send failure notification
         try:
-            config_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'config.ini')
-            accounts_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'accounts.json')
-            config_manager = ConfigManager(config_file, accounts_file)
+            config_manager = ConfigManager(CONFIG_FILE, ACCOUNTS_FILE)
             
             sns_topic_arn = config_manager.get_sns_topic_arn()
             if sns_topic_arn:
@@ -1,31 +1,230 @@
 import boto3
 import logging
+import random
 import time
+import botocore.config
 import botocore.exceptions
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import repeat
+
+# One session for every RDSOperations instance, so credentials are resolved
+# and service models loaded once however many regions are processed
+_SESSION = boto3.session.Session()
 
 class RDSOperationError(Exception):
     """Exception raised for RDS operation errors."""
     pass
 
+# Maximum number of identifiers passed in a single describe filter
+DESCRIBE_FILTER_BATCH_SIZE = 100
+
+# Largest page size get_resources allows. The describe calls are left at
+# their default, which is already their 100-record maximum
+TAGGING_PAGINATION_CONFIG = {'PageSize': 100}
+
+# Identifiers described per call while polling verification state
+VERIFY_BATCH_SIZE = 20
+
+# Connections each RDS/tagging client keeps open. Callers sharing one
+# RDSOperations across threads should keep their combined tag_workers or
+# action_workers within this, or calls queue for a free connection
+MAX_POOL_CONNECTIONS = 32
+
+# Default number of concurrent ListTagsForResource calls
+TAG_LOOKUP_WORKERS = 8
+
+# Default number of concurrent start/stop calls
+ACTION_WORKERS = 8
+
+# First verification re-check delay in seconds; doubles up to check_interval
+VERIFY_BACKOFF_BASE = 2
+
+# Exponent cap so the delay computation stays bounded on long waits
+VERIFY_BACKOFF_MAX_EXPONENT = 10
+
+# Fields shared by every successful (or dry-run) start/stop result
+_START_RESULT = {'Action': 'start', 'PreviousStatus': 'stopped', 'CurrentStatus': 'starting'}
+_STOP_RESULT = {'Action': 'stop', 'PreviousStatus': 'available', 'CurrentStatus': 'stopping'}
+
+# Errors recorded on a single resource's start/stop result. Connection
+# failures and timeouts are BotoCoreErrors rather than ClientErrors, and
+# must not abort the rest of the batch
+_ACTION_ERRORS = (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError)
+
+# Error codes returned when the caller lacks tag:GetResources
+ACCESS_DENIED_CODES = ('AccessDenied', 'AccessDeniedException')
+
+# Only Aurora PostgreSQL clusters are scheduled; filtered server-side
+CLUSTER_ENGINE_FILTER = {'Name': 'engine', 'Values': ['aurora-postgresql']}
+
+# Describe paginator attribute, result key, ARN field and describe filters
+# for each tagging API resource type
+RESOURCE_ARN_SOURCES = {
+    'rds:cluster': ('_clusters_paginator', 'DBClusters', 'DBClusterArn', [CLUSTER_ENGINE_FILTER]),
+    'rds:db': ('_instances_paginator', 'DBInstances', 'DBInstanceArn', [])
+}
+
+def _backoff_delay(attempt, check_interval):
+    """Compute the delay before the next verification poll.
+    
+    Starts short so fast state transitions are picked up quickly, then
+    grows exponentially (with jitter) up to check_interval.
+    
+    Args:
+        attempt (int): Number of polls already made
+        check_interval (int): Maximum delay in seconds
+        
+    Returns:
+        float: Delay in seconds
+    """
+    exponent = min(attempt, VERIFY_BACKOFF_MAX_EXPONENT)
+    return min(check_interval, VERIFY_BACKOFF_BASE * (2 ** exponent) + random.uniform(0, VERIFY_BACKOFF_BASE))
+
+def _now_iso():
+    """Return the current local time as an ISO 8601 string, as used in results.
+    
+    Returns:
+        str: Timestamp such as 2024-01-31T18:00:00.123456
+    """
+    return datetime.now().isoformat()
+
+def _error_details(error):
+    """Extract the error code and message from a botocore error.
+    
+    Args:
+        error (Exception): ClientError or BotoCoreError raised by a client call
+        
+    Returns:
+        tuple: (error code, error message)
+    """
+    if isinstance(error, botocore.exceptions.ClientError):
+        details = error.response.get('Error', {})
+        return details.get('Code', 'Unknown'), details.get('Message') or str(error)
+    # BotoCoreErrors carry no AWS error code, so use the exception class name
+    return type(error).__name__, str(error)
+
+def _chunked(items, size):
+    """Split a list into consecutive chunks.
+    
+    Args:
+        items (list): Items to split
+        size (int): Maximum chunk size
+        
+    Returns:
+        generator: Lists of at most size items
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 class RDSOperations:
     """Handles RDS and Aurora cluster operations."""
     
-    def __init__(self, region, dry_run=False):
+    def __init__(self, region, dry_run=False, tag_workers=TAG_LOOKUP_WORKERS, action_workers=ACTION_WORKERS):
         """Initialize RDS operations.
         
         Args:
             region (str): AWS region
             dry_run (bool): Whether to run in dry-run mode
+            tag_workers (int): Maximum concurrent ListTagsForResource calls
+            action_workers (int): Maximum concurrent start/stop calls
         """
         self.logger = logging.getLogger(__name__)
         self.region = region
         self.dry_run = dry_run
-        self.rds_client = boto3.client('rds', region_name=region)
+        self.tag_workers = tag_workers
+        self.action_workers = action_workers
+        # Adaptive retries rate-limit the client when RDS starts throttling;
+        # size the connection pool so concurrent calls reuse connections
+        client_config = botocore.config.Config(
+            retries={'mode': 'adaptive', 'max_attempts': 10},
+            max_pool_connections=max(MAX_POOL_CONNECTIONS, tag_workers, action_workers),
+            user_agent_extra='atis-rds-scheduler'
+        )
+        self.rds_client = _SESSION.client('rds', region_name=region, config=client_config)
+        self.tagging_client = _SESSION.client('resourcegroupstaggingapi', region_name=region, config=client_config)
+        
+        # Paginators are reusable; build them once per client
+        self._clusters_paginator = self.rds_client.get_paginator('describe_db_clusters')
+        self._instances_paginator = self.rds_client.get_paginator('describe_db_instances')
+        self._tagged_resources_paginator = self.tagging_client.get_paginator('get_resources')
         
         if self.dry_run:
             self.logger.info("RDS Operations initialized in DRY RUN mode - no actual changes will be made")
 
+    def _find_tagged_resource_ids(self, resource_type, tag_key, tag_value):
+        """Find identifiers of RDS resources with the specified tag.
+        
+        Tag matching is done server-side by the Resource Groups Tagging API.
+        If the caller is not allowed to use it, falls back to listing the
+        tags of every resource concurrently.
+        
+        Args:
+            resource_type (str): Tagging API resource type (rds:cluster or rds:db)
+            tag_key (str): Tag key to filter on
+            tag_value (str): Tag value to filter on
+            
+        Returns:
+            list: List of resource identifiers
+        """
+        resource_ids = []
+        paginator = self._tagged_resources_paginator
+        
+        try:
+            for page in paginator.paginate(ResourceTypeFilters=[resource_type],
+                                           TagFilters=[{'Key': tag_key, 'Values': [tag_value]}],
+                                           PaginationConfig=TAGGING_PAGINATION_CONFIG):
+                for mapping in page['ResourceTagMappingList']:
+                    # ARN format: arn:aws:rds:<region>:<account>:<cluster|db>:<identifier>
+                    resource_ids.append(mapping['ResourceARN'].split(':')[-1])
+        except botocore.exceptions.ClientError as e:
+            if e.response.get('Error', {}).get('Code') not in ACCESS_DENIED_CODES:
+                raise
+            self.logger.warning(f"tag:GetResources not permitted, falling back to ListTagsForResource: {str(e)}")
+            return self._filter_resource_ids_by_tag(resource_type, tag_key, tag_value)
+                
+        return resource_ids
+
+    def _filter_resource_ids_by_tag(self, resource_type, tag_key, tag_value):
+        """Find identifiers of RDS resources with the specified tag using ListTagsForResource.
+        
+        The tag lookups are independent network calls, so they are issued
+        from a bounded thread pool rather than one after another.
+        
+        Args:
+            resource_type (str): Tagging API resource type (rds:cluster or rds:db)
+            tag_key (str): Tag key to filter on
+            tag_value (str): Tag value to filter on
+            
+        Returns:
+            list: List of resource identifiers
+        """
+        paginator_attr, result_key, arn_key, filters = RESOURCE_ARN_SOURCES[resource_type]
+        paginator = getattr(self, paginator_attr)
+        pages = paginator.paginate(Filters=filters)
+        resources = [resource for page in pages for resource in page[result_key]]
+        if resource_type == 'rds:db':
+            # Aurora cluster members are managed at cluster level, so don't look up their tags
+            resources = [resource for resource in resources if not resource.get('DBClusterIdentifier')]
+        arns = [resource[arn_key] for resource in resources]
+        
+        def get_tags(arn):
+            try:
+                return self.rds_client.list_tags_for_resource(ResourceName=arn)['TagList']
+            except botocore.exceptions.ClientError as e:
+                self.logger.warning(f"Could not get tags for {arn}: {str(e)}")
+                return []
+        
+        with ThreadPoolExecutor(max_workers=self.tag_workers) as executor:
+            tag_lists = list(executor.map(get_tags, arns))
+            
+        resource_ids = []
+        for arn, tag_list in zip(arns, tag_lists):
+            if any(tag['Key'] == tag_key and tag['Value'] == tag_value for tag in tag_list):
+                resource_ids.append(arn.split(':')[-1])
+                
+        return resource_ids
+
     def find_tagged_clusters(self, tag_key, tag_value):
         """Find Aurora clusters with the specified tag.
         
@@ -37,7 +236,7 @@ class RDSOperations:
             list: List of cluster dictionaries
         """
         try:
-            self.logger.info(f"Finding Aurora clusters with tag {tag_key}:{tag_value}")
+            self.logger.info("Finding Aurora clusters with tag %s:%s", tag_key, tag_value)
             
             if self.dry_run:
                 self.logger.info("[DRY RUN] Would search for tagged Aurora clusters")
@@ -52,34 +251,24 @@ class RDSOperations:
                     ]
                 }]
             
+            cluster_ids = self._find_tagged_resource_ids('rds:cluster', tag_key, tag_value)
+            
             clusters = []
-            paginator = self.rds_client.get_paginator('describe_db_clusters')
+            paginator = self._clusters_paginator
             
-            for page in paginator.paginate():
-                for cluster in page['DBClusters']:
-                    # Only process Aurora PostgreSQL clusters
-                    if not cluster['Engine'].startswith('aurora-postgresql'):
-                        continue
-                        
-                    cluster_arn = cluster['DBClusterArn']
-                    
-                    try:
-                        tags_response = self.rds_client.list_tags_for_resource(ResourceName=cluster_arn)
-                        tag_dict = {tag['Key']: tag['Value'] for tag in tags_response['TagList']}
-                        
-                        if tag_dict.get(tag_key) == tag_value:
-                            clusters.append({
-                                'DBClusterIdentifier': cluster['DBClusterIdentifier'],
-                                'DBClusterArn': cluster_arn,
-                                'Status': cluster['Status'],
-                                'Engine': cluster['Engine'],
-                                'DBClusterMembers': cluster.get('DBClusterMembers', [])
-                            })
-                    except botocore.exceptions.ClientError as e:
-                        self.logger.warning(f"Could not get tags for cluster {cluster['DBClusterIdentifier']}: {str(e)}")
-                        continue
+            for chunk in _chunked(cluster_ids, DESCRIBE_FILTER_BATCH_SIZE):
+                for page in paginator.paginate(Filters=[{'Name': 'db-cluster-id', 'Values': chunk},
+                                                        CLUSTER_ENGINE_FILTER]):
+                    for cluster in page['DBClusters']:
+                        clusters.append({
+                            'DBClusterIdentifier': cluster['DBClusterIdentifier'],
+                            'DBClusterArn': cluster['DBClusterArn'],
+                            'Status': cluster['Status'],
+                            'Engine': cluster['Engine'],
+                            'DBClusterMembers': cluster.get('DBClusterMembers', [])
+                        })
             
-            self.logger.info(f"Found {len(clusters)} tagged Aurora PostgreSQL clusters")
+            self.logger.info("Found %d tagged Aurora PostgreSQL clusters", len(clusters))
             return clusters
             
         except botocore.exceptions.ClientError as e:
@@ -97,7 +286,7 @@ class RDSOperations:
             list: List of instance dictionaries
         """
         try:
-            self.logger.info(f"Finding RDS instances with tag {tag_key}:{tag_value}")
+            self.logger.info("Finding RDS instances with tag %s:%s", tag_key, tag_value)
             
             if self.dry_run:
                 self.logger.info("[DRY RUN] Would search for tagged RDS instances")
@@ -108,39 +297,114 @@ class RDSOperations:
                     'Engine': 'postgres'
                 }]
             
+            instance_ids = self._find_tagged_resource_ids('rds:db', tag_key, tag_value)
+            
             instances = []
-            paginator = self.rds_client.get_paginator('describe_db_instances')
+            paginator = self._instances_paginator
             
-            for page in paginator.paginate():
-                for instance in page['DBInstances']:
-                    # Skip Aurora cluster members (they're managed at cluster level)
-                    if instance.get('DBClusterIdentifier'):
-                        continue
-                        
-                    instance_arn = instance['DBInstanceArn']
-                    
-                    try:
-                        tags_response = self.rds_client.list_tags_for_resource(ResourceName=instance_arn)
-                        tag_dict = {tag['Key']: tag['Value'] for tag in tags_response['TagList']}
-                        
-                        if tag_dict.get(tag_key) == tag_value:
-                            instances.append({
-                                'DBInstanceIdentifier': instance['DBInstanceIdentifier'],
-                                'DBInstanceArn': instance_arn,
-                                'DBInstanceStatus': instance['DBInstanceStatus'],
-                                'Engine': instance['Engine']
-                            })
-                    except botocore.exceptions.ClientError as e:
-                        self.logger.warning(f"Could not get tags for instance {instance['DBInstanceIdentifier']}: {str(e)}")
-                        continue
+            for chunk in _chunked(instance_ids, DESCRIBE_FILTER_BATCH_SIZE):
+                for page in paginator.paginate(Filters=[{'Name': 'db-instance-id', 'Values': chunk}]):
+                    for instance in page['DBInstances']:
+                        # Skip Aurora cluster members (they're managed at cluster level)
+                        if instance.get('DBClusterIdentifier'):
+                            continue
+                            
+                        instances.append({
+                            'DBInstanceIdentifier': instance['DBInstanceIdentifier'],
+                            'DBInstanceArn': instance['DBInstanceArn'],
+                            'DBInstanceStatus': instance['DBInstanceStatus'],
+                            'Engine': instance['Engine']
+                        })
             
-            self.logger.info(f"Found {len(instances)} tagged RDS instances")
+            self.logger.info("Found %d tagged RDS instances", len(instances))
             return instances
             
         except botocore.exceptions.ClientError as e:
             self.logger.error(f"Error finding tagged RDS instances: {str(e)}")
             raise RDSOperationError(f"Error finding tagged RDS instances: {str(e)}")
 
+    def _run_concurrently(self, worker, identifiers):
+        """Apply a per-resource start/stop worker to every identifier concurrently.
+        
+        Args:
+            worker (callable): Function taking an identifier and the batch timestamp
+                and returning a (bucket, result) tuple
+            identifiers (list): Resource identifiers
+            
+        Returns:
+            dict: Result of operation with success and failures, in input order
+        """
+        results = {'succeeded': [], 'failed': []}
+        # All results of one batch share a timestamp
+        timestamp = _now_iso()
+        
+        with ThreadPoolExecutor(max_workers=min(self.action_workers, len(identifiers))) as executor:
+            for bucket, result in executor.map(worker, identifiers, repeat(timestamp)):
+                results[bucket].append(result)
+                
+        return results
+
+    def batch_start(self, resources):
+        """Start a mixed list of Aurora clusters and RDS instances.
+        
+        Args:
+            resources (list): Cluster and instance dictionaries as returned by
+                find_tagged_clusters / find_tagged_instances
+            
+        Returns:
+            dict: Result of operation with success and failures
+        """
+        return self._run_batch('start', resources, self._start_cluster, self._start_instance)
+
+    def batch_stop(self, resources):
+        """Stop a mixed list of Aurora clusters and RDS instances.
+        
+        Args:
+            resources (list): Cluster and instance dictionaries as returned by
+                find_tagged_clusters / find_tagged_instances
+            
+        Returns:
+            dict: Result of operation with success and failures
+        """
+        return self._run_batch('stop', resources, self._stop_cluster, self._stop_instance)
+
+    def _run_batch(self, action, resources, cluster_worker, instance_worker):
+        """Dispatch a start/stop over clusters and instances in one concurrent batch.
+        
+        RDS has no batch start/stop API, so each resource is still a separate
+        call; they all share one bounded worker pool.
+        
+        Args:
+            action (str): Action name for logging (start/stop)
+            resources (list): Cluster and instance dictionaries
+            cluster_worker (callable): Per-cluster worker
+            instance_worker (callable): Per-instance worker
+            
+        Returns:
+            dict: Result of operation with success and failures
+        """
+        tasks = []
+        for resource in resources:
+            if 'DBClusterIdentifier' in resource:
+                tasks.append((cluster_worker, resource['DBClusterIdentifier']))
+            elif 'DBInstanceIdentifier' in resource:
+                tasks.append((instance_worker, resource['DBInstanceIdentifier']))
+            else:
+                raise RDSOperationError(f"Unrecognised RDS resource: {resource}")
+                
+        if not tasks:
+            self.logger.info("No resources to %s", action)
+            return {'succeeded': [], 'failed': []}
+        
+        def run_task(task, timestamp):
+            worker, identifier = task
+            return worker(identifier, timestamp)
+        
+        results = self._run_concurrently(run_task, tasks)
+        self.logger.info("Batch %s of %d resources: %d succeeded, %d failed",
+                         action, len(tasks), len(results['succeeded']), len(results['failed']))
+        return results
+
     def start_clusters(self, cluster_identifiers):
         """Start Aurora clusters.
         
@@ -154,46 +418,39 @@ class RDSOperations:
             self.logger.info("No clusters to start")
             return {'succeeded': [], 'failed': []}
             
-        results = {'succeeded': [], 'failed': []}
+        return self._run_concurrently(self._start_cluster, cluster_identifiers)
+
+    def _start_cluster(self, cluster_id, timestamp):
+        """Start a single Aurora cluster.
         
-        for cluster_id in cluster_identifiers:
-            try:
-                if self.dry_run:
-                    self.logger.info(f"[DRY RUN] Would start Aurora cluster: {cluster_id}")
-                    results['succeeded'].append({
-                        'DBClusterIdentifier': cluster_id,
-                        'Action': 'start',
-                        'PreviousStatus': 'stopped',
-                        'CurrentStatus': 'starting',
-                        'Timestamp': datetime.now().isoformat(),
-                        'Status': 'DryRun'
-                    })
-                    continue
-                
-                self.logger.info(f"Starting Aurora cluster: {cluster_id}")
-                self.rds_client.start_db_cluster(DBClusterIdentifier=cluster_id)
-                
-                results['succeeded'].append({
-                    'DBClusterIdentifier': cluster_id,
-                    'Action': 'start',
-                    'PreviousStatus': 'stopped',
-                    'CurrentStatus': 'starting',
-                    'Timestamp': datetime.now().isoformat(),
-                    'Status': 'Success'
-                })
-                
-            except botocore.exceptions.ClientError as e:
-                error_msg = str(e)
-                self.logger.error(f"Error starting Aurora cluster {cluster_id}: {error_msg}")
-                results['failed'].append({
-                    'DBClusterIdentifier': cluster_id,
-                    'Action': 'start',
-                    'Timestamp': datetime.now().isoformat(),
-                    'Status': 'Failed',
-                    'Error': error_msg
-                })
-                
-        return results
+        Args:
+            cluster_id (str): Aurora cluster identifier
+            timestamp (str): Timestamp recorded on the result
+            
+        Returns:
+            tuple: ('succeeded' or 'failed', result dictionary)
+        """
+        try:
+            if self.dry_run:
+                self.logger.info("[DRY RUN] Would start Aurora cluster: %s", cluster_id)
+                return 'succeeded', {'DBClusterIdentifier': cluster_id, **_START_RESULT, 'Timestamp': timestamp, 'Status': 'DryRun'}
+            
+            self.logger.info("Starting Aurora cluster: %s", cluster_id)
+            self.rds_client.start_db_cluster(DBClusterIdentifier=cluster_id)
+            
+            return 'succeeded', {'DBClusterIdentifier': cluster_id, **_START_RESULT, 'Timestamp': timestamp, 'Status': 'Success'}
+            
+        except _ACTION_ERRORS as e:
+            error_code, error_msg = _error_details(e)
+            self.logger.error(f"Error starting Aurora cluster {cluster_id}: {error_code}: {error_msg}")
+            return 'failed', {
+                'DBClusterIdentifier': cluster_id,
+                'Action': 'start',
+                'Timestamp': timestamp,
+                'Status': 'Failed',
+                'ErrorCode': error_code,
+                'Error': error_msg
+            }
 
     def stop_clusters(self, cluster_identifiers):
         """Stop Aurora clusters.
@@ -208,46 +465,39 @@ class RDSOperations:
             self.logger.info("No clusters to stop")
             return {'succeeded': [], 'failed': []}
             
-        results = {'succeeded': [], 'failed': []}
+        return self._run_concurrently(self._stop_cluster, cluster_identifiers)
+
+    def _stop_cluster(self, cluster_id, timestamp):
+        """Stop a single Aurora cluster.
         
-        for cluster_id in cluster_identifiers:
-            try:
-                if self.dry_run:
-                    self.logger.info(f"[DRY RUN] Would stop Aurora cluster: {cluster_id}")
-                    results['succeeded'].append({
-                        'DBClusterIdentifier': cluster_id,
-                        'Action': 'stop',
-                        'PreviousStatus': 'available',
-                        'CurrentStatus': 'stopping',
-                        'Timestamp': datetime.now().isoformat(),
-                        'Status': 'DryRun'
-                    })
-                    continue
-                
-                self.logger.info(f"Stopping Aurora cluster: {cluster_id}")
-                self.rds_client.stop_db_cluster(DBClusterIdentifier=cluster_id)
-                
-                results['succeeded'].append({
-                    'DBClusterIdentifier': cluster_id,
-                    'Action': 'stop',
-                    'PreviousStatus': 'available',
-                    'CurrentStatus': 'stopping',
-                    'Timestamp': datetime.now().isoformat(),
-                    'Status': 'Success'
-                })
-                
-            except botocore.exceptions.ClientError as e:
-                error_msg = str(e)
-                self.logger.error(f"Error stopping Aurora cluster {cluster_id}: {error_msg}")
-                results['failed'].append({
-                    'DBClusterIdentifier': cluster_id,
-                    'Action': 'stop',
-                    'Timestamp': datetime.now().isoformat(),
-                    'Status': 'Failed',
-                    'Error': error_msg
-                })
-                
-        return results
+        Args:
+            cluster_id (str): Aurora cluster identifier
+            timestamp (str): Timestamp recorded on the result
+            
+        Returns:
+            tuple: ('succeeded' or 'failed', result dictionary)
+        """
+        try:
+            if self.dry_run:
+                self.logger.info("[DRY RUN] Would stop Aurora cluster: %s", cluster_id)
+                return 'succeeded', {'DBClusterIdentifier': cluster_id, **_STOP_RESULT, 'Timestamp': timestamp, 'Status': 'DryRun'}
+            
+            self.logger.info("Stopping Aurora cluster: %s", cluster_id)
+            self.rds_client.stop_db_cluster(DBClusterIdentifier=cluster_id)
+            
+            return 'succeeded', {'DBClusterIdentifier': cluster_id, **_STOP_RESULT, 'Timestamp': timestamp, 'Status': 'Success'}
+            
+        except _ACTION_ERRORS as e:
+            error_code, error_msg = _error_details(e)
+            self.logger.error(f"Error stopping Aurora cluster {cluster_id}: {error_code}: {error_msg}")
+            return 'failed', {
+                'DBClusterIdentifier': cluster_id,
+                'Action': 'stop',
+                'Timestamp': timestamp,
+                'Status': 'Failed',
+                'ErrorCode': error_code,
+                'Error': error_msg
+            }
 
     def start_instances(self, instance_identifiers):
         """Start standalone RDS instances.
@@ -262,46 +512,39 @@ class RDSOperations:
             self.logger.info("No instances to start")
             return {'succeeded': [], 'failed': []}
             
-        results = {'succeeded': [], 'failed': []}
+        return self._run_concurrently(self._start_instance, instance_identifiers)
+
+    def _start_instance(self, instance_id, timestamp):
+        """Start a single RDS instance.
         
-        for instance_id in instance_identifiers:
-            try:
-                if self.dry_run:
-                    self.logger.info(f"[DRY RUN] Would start RDS instance: {instance_id}")
-                    results['succeeded'].append({
-                        'DBInstanceIdentifier': instance_id,
-                        'Action': 'start',
-                        'PreviousStatus': 'stopped',
-                        'CurrentStatus': 'starting',
-                        'Timestamp': datetime.now().isoformat(),
-                        'Status': 'DryRun'
-                    })
-                    continue
-                
-                self.logger.info(f"Starting RDS instance: {instance_id}")
-                self.rds_client.start_db_instance(DBInstanceIdentifier=instance_id)
-                
-                results['succeeded'].append({
-                    'DBInstanceIdentifier': instance_id,
-                    'Action': 'start',
-                    'PreviousStatus': 'stopped',
-                    'CurrentStatus': 'starting',
-                    'Timestamp': datetime.now().isoformat(),
-                    'Status': 'Success'
-                })
-                
-            except botocore.exceptions.ClientError as e:
-                error_msg = str(e)
-                self.logger.error(f"Error starting RDS instance {instance_id}: {error_msg}")
-                results['failed'].append({
-                    'DBInstanceIdentifier': instance_id,
-                    'Action': 'start',
-                    'Timestamp': datetime.now().isoformat(),
-                    'Status': 'Failed',
-                    'Error': error_msg
-                })
-                
-        return results
+        Args:
+            instance_id (str): RDS instance identifier
+            timestamp (str): Timestamp recorded on the result
+            
+        Returns:
+            tuple: ('succeeded' or 'failed', result dictionary)
+        """
+        try:
+            if self.dry_run:
+                self.logger.info("[DRY RUN] Would start RDS instance: %s", instance_id)
+                return 'succeeded', {'DBInstanceIdentifier': instance_id, **_START_RESULT, 'Timestamp': timestamp, 'Status': 'DryRun'}
+            
+            self.logger.info("Starting RDS instance: %s", instance_id)
+            self.rds_client.start_db_instance(DBInstanceIdentifier=instance_id)
+            
+            return 'succeeded', {'DBInstanceIdentifier': instance_id, **_START_RESULT, 'Timestamp': timestamp, 'Status': 'Success'}
+            
+        except _ACTION_ERRORS as e:
+            error_code, error_msg = _error_details(e)
+            self.logger.error(f"Error starting RDS instance {instance_id}: {error_code}: {error_msg}")
+            return 'failed', {
+                'DBInstanceIdentifier': instance_id,
+                'Action': 'start',
+                'Timestamp': timestamp,
+                'Status': 'Failed',
+                'ErrorCode': error_code,
+                'Error': error_msg
+            }
 
     def stop_instances(self, instance_identifiers):
         """Stop standalone RDS instances.
@@ -316,46 +559,39 @@ class RDSOperations:
             self.logger.info("No instances to stop")
             return {'succeeded': [], 'failed': []}
             
-        results = {'succeeded': [], 'failed': []}
+        return self._run_concurrently(self._stop_instance, instance_identifiers)
+
+    def _stop_instance(self, instance_id, timestamp):
+        """Stop a single RDS instance.
         
-        for instance_id in instance_identifiers:
-            try:
-                if self.dry_run:
-                    self.logger.info(f"[DRY RUN] Would stop RDS instance: {instance_id}")
-                    results['succeeded'].append({
-                        'DBInstanceIdentifier': instance_id,
-                        'Action': 'stop',
-                        'PreviousStatus': 'available',
-                        'CurrentStatus': 'stopping',
-                        'Timestamp': datetime.now().isoformat(),
-                        'Status': 'DryRun'
-                    })
-                    continue
-                
-                self.logger.info(f"Stopping RDS instance: {instance_id}")
-                self.rds_client.stop_db_instance(DBInstanceIdentifier=instance_id)
-                
-                results['succeeded'].append({
-                    'DBInstanceIdentifier': instance_id,
-                    'Action': 'stop',
-                    'PreviousStatus': 'available',
-                    'CurrentStatus': 'stopping',
-                    'Timestamp': datetime.now().isoformat(),
-                    'Status': 'Success'
-                })
-                
-            except botocore.exceptions.ClientError as e:
-                error_msg = str(e)
-                self.logger.error(f"Error stopping RDS instance {instance_id}: {error_msg}")
-                results['failed'].append({
-                    'DBInstanceIdentifier': instance_id,
-                    'Action': 'stop',
-                    'Timestamp': datetime.now().isoformat(),
-                    'Status': 'Failed',
-                    'Error': error_msg
-                })
-                
-        return results
+        Args:
+            instance_id (str): RDS instance identifier
+            timestamp (str): Timestamp recorded on the result
+            
+        Returns:
+            tuple: ('succeeded' or 'failed', result dictionary)
+        """
+        try:
+            if self.dry_run:
+                self.logger.info("[DRY RUN] Would stop RDS instance: %s", instance_id)
+                return 'succeeded', {'DBInstanceIdentifier': instance_id, **_STOP_RESULT, 'Timestamp': timestamp, 'Status': 'DryRun'}
+            
+            self.logger.info("Stopping RDS instance: %s", instance_id)
+            self.rds_client.stop_db_instance(DBInstanceIdentifier=instance_id)
+            
+            return 'succeeded', {'DBInstanceIdentifier': instance_id, **_STOP_RESULT, 'Timestamp': timestamp, 'Status': 'Success'}
+            
+        except _ACTION_ERRORS as e:
+            error_code, error_msg = _error_details(e)
+            self.logger.error(f"Error stopping RDS instance {instance_id}: {error_code}: {error_msg}")
+            return 'failed', {
+                'DBInstanceIdentifier': instance_id,
+                'Action': 'stop',
+                'Timestamp': timestamp,
+                'Status': 'Failed',
+                'ErrorCode': error_code,
+                'Error': error_msg
+            }
 
     def verify_cluster_states(self, cluster_identifiers, expected_state, timeout=600, check_interval=30):
         """Verify Aurora clusters have reached the expected state.
@@ -364,7 +600,7 @@ class RDSOperations:
             cluster_identifiers (list): List of cluster identifiers
             expected_state (str): Expected state (available/stopped)
             timeout (int): Timeout in seconds (default 10 minutes)
-            check_interval (int): Interval between checks in seconds
+            check_interval (int): Maximum interval between checks in seconds
             
         Returns:
             dict: Verification results
@@ -373,68 +609,76 @@ class RDSOperations:
             return {'verified': [], 'failed': []}
             
         if self.dry_run:
-            self.logger.info(f"[DRY RUN] Would verify cluster states: {expected_state}")
+            self.logger.info("[DRY RUN] Would verify cluster states: %s", expected_state)
+            timestamp = _now_iso()
             return {
                 'verified': [{'DBClusterIdentifier': cid, 'CurrentStatus': expected_state, 
-                            'Timestamp': datetime.now().isoformat()} for cid in cluster_identifiers],
+                            'Timestamp': timestamp} for cid in cluster_identifiers],
                 'failed': []
             }
             
         results = {'verified': [], 'failed': []}
-        pending_clusters = cluster_identifiers.copy()
+        pending_clusters = set(cluster_identifiers)
         
-        self.logger.info(f"Verifying state for clusters: {pending_clusters}, expected: {expected_state}")
+        self.logger.info("Verifying state for %d clusters, expected: %s", len(cluster_identifiers), expected_state)
+        self.logger.debug("Clusters to verify: %s", cluster_identifiers)
         
         end_time = time.time() + timeout
+        attempt = 0
         while time.time() < end_time and pending_clusters:
+            # Results of one sweep share a timestamp
+            timestamp = _now_iso()
             try:
-                response = self.rds_client.describe_db_clusters(
-                    DBClusterIdentifiers=pending_clusters
-                )
-                
-                still_pending = []
-                for cluster in response.get('DBClusters', []):
-                    cluster_id = cluster['DBClusterIdentifier']
-                    current_state = cluster['Status']
+                for chunk in _chunked(list(pending_clusters), VERIFY_BATCH_SIZE):
+                    response = self.rds_client.describe_db_clusters(
+                        Filters=[{'Name': 'db-cluster-id', 'Values': chunk}]
+                    )
                     
-                    if current_state == expected_state:
-                        self.logger.info(f"Cluster {cluster_id} state verified: {current_state}")
-                        results['verified'].append({
-                            'DBClusterIdentifier': cluster_id,
-                            'CurrentStatus': current_state,
-                            'Timestamp': datetime.now().isoformat()
-                        })
-                    else:
-                        self.logger.debug(f"Cluster {cluster_id} state: {current_state}, waiting for {expected_state}")
-                        still_pending.append(cluster_id)
-                
-                pending_clusters = still_pending
+                    for cluster in response.get('DBClusters', []):
+                        cluster_id = cluster['DBClusterIdentifier']
+                        current_state = cluster['Status']
+                        
+                        if current_state == expected_state:
+                            self.logger.info("Cluster %s state verified: %s", cluster_id, current_state)
+                            results['verified'].append({
+                                'DBClusterIdentifier': cluster_id,
+                                'CurrentStatus': current_state,
+                                'Timestamp': timestamp
+                            })
+                            pending_clusters.discard(cluster_id)
+                        else:
+                            self.logger.debug("Cluster %s state: %s, waiting for %s", cluster_id, current_state, expected_state)
                 
                 if not pending_clusters:
                     break
                     
-                time.sleep(check_interval)
+                time.sleep(_backoff_delay(attempt, check_interval))
+                attempt += 1
                 
             except botocore.exceptions.ClientError as e:
                 self.logger.error(f"Error verifying cluster states: {str(e)}")
                 
                 # Mark all pending clusters as failed
-                for cluster_id in pending_clusters:
-                    results['failed'].append({
-                        'DBClusterIdentifier': cluster_id,
-                        'Error': str(e),
-                        'Timestamp': datetime.now().isoformat()
-                    })
+                for cluster_id in cluster_identifiers:
+                    if cluster_id in pending_clusters:
+                        results['failed'].append({
+                            'DBClusterIdentifier': cluster_id,
+                            'Error': str(e),
+                            'Timestamp': timestamp
+                        })
+                pending_clusters.clear()
                 break
         
-        # Mark any remaining clusters as timed out
-        for cluster_id in pending_clusters:
-            self.logger.warning(f"Cluster {cluster_id} verification timed out")
-            results['failed'].append({
-                'DBClusterIdentifier': cluster_id,
-                'Error': f'Verification timed out after {timeout} seconds',
-                'Timestamp': datetime.now().isoformat()
-            })
+        # Mark any remaining clusters as timed out, in input order
+        timestamp = _now_iso()
+        for cluster_id in cluster_identifiers:
+            if cluster_id in pending_clusters:
+                self.logger.warning(f"Cluster {cluster_id} verification timed out")
+                results['failed'].append({
+                    'DBClusterIdentifier': cluster_id,
+                    'Error': f'Verification timed out after {timeout} seconds',
+                    'Timestamp': timestamp
+                })
         
         return results
 
@@ -445,7 +689,7 @@ class RDSOperations:
             instance_identifiers (list): List of instance identifiers
             expected_state (str): Expected state (available/stopped)
             timeout (int): Timeout in seconds (default 5 minutes)
-            check_interval (int): Interval between checks in seconds
+            check_interval (int): Maximum interval between checks in seconds
             
         Returns:
             dict: Verification results
@@ -454,67 +698,75 @@ class RDSOperations:
             return {'verified': [], 'failed': []}
             
         if self.dry_run:
-            self.logger.info(f"[DRY RUN] Would verify instance states: {expected_state}")
+            self.logger.info("[DRY RUN] Would verify instance states: %s", expected_state)
+            timestamp = _now_iso()
             return {
                 'verified': [{'DBInstanceIdentifier': iid, 'CurrentStatus': expected_state, 
-                            'Timestamp': datetime.now().isoformat()} for iid in instance_identifiers],
+                            'Timestamp': timestamp} for iid in instance_identifiers],
                 'failed': []
             }
             
         results = {'verified': [], 'failed': []}
-        pending_instances = instance_identifiers.copy()
+        pending_instances = set(instance_identifiers)
         
-        self.logger.info(f"Verifying state for instances: {pending_instances}, expected: {expected_state}")
+        self.logger.info("Verifying state for %d instances, expected: %s", len(instance_identifiers), expected_state)
+        self.logger.debug("Instances to verify: %s", instance_identifiers)
         
         end_time = time.time() + timeout
+        attempt = 0
         while time.time() < end_time and pending_instances:
+            # Results of one sweep share a timestamp
+            timestamp = _now_iso()
             try:
-                response = self.rds_client.describe_db_instances(
-                    DBInstanceIdentifiers=pending_instances
-                )
-                
-                still_pending = []
-                for instance in response.get('DBInstances', []):
-                    instance_id = instance['DBInstanceIdentifier']
-                    current_state = instance['DBInstanceStatus']
+                for chunk in _chunked(list(pending_instances), VERIFY_BATCH_SIZE):
+                    response = self.rds_client.describe_db_instances(
+                        Filters=[{'Name': 'db-instance-id', 'Values': chunk}]
+                    )
                     
-                    if current_state == expected_state:
-                        self.logger.info(f"Instance {instance_id} state verified: {current_state}")
-                        results['verified'].append({
-                            'DBInstanceIdentifier': instance_id,
-                            'CurrentStatus': current_state,
-                            'Timestamp': datetime.now().isoformat()
-                        })
-                    else:
-                        self.logger.debug(f"Instance {instance_id} state: {current_state}, waiting for {expected_state}")
-                        still_pending.append(instance_id)
-                
-                pending_instances = still_pending
+                    for instance in response.get('DBInstances', []):
+                        instance_id = instance['DBInstanceIdentifier']
+                        current_state = instance['DBInstanceStatus']
+                        
+                        if current_state == expected_state:
+                            self.logger.info("Instance %s state verified: %s", instance_id, current_state)
+                            results['verified'].append({
+                                'DBInstanceIdentifier': instance_id,
+                                'CurrentStatus': current_state,
+                                'Timestamp': timestamp
+                            })
+                            pending_instances.discard(instance_id)
+                        else:
+                            self.logger.debug("Instance %s state: %s, waiting for %s", instance_id, current_state, expected_state)
                 
                 if not pending_instances:
                     break
                     
-                time.sleep(check_interval)
+                time.sleep(_backoff_delay(attempt, check_interval))
+                attempt += 1
                 
             except botocore.exceptions.ClientError as e:
                 self.logger.error(f"Error verifying instance states: {str(e)}")
                 
                 # Mark all pending instances as failed
-                for instance_id in pending_instances:
-                    results['failed'].append({
-                        'DBInstanceIdentifier': instance_id,
-                        'Error': str(e),
-                        'Timestamp': datetime.now().isoformat()
-                    })
+                for instance_id in instance_identifiers:
+                    if instance_id in pending_instances:
+                        results['failed'].append({
+                            'DBInstanceIdentifier': instance_id,
+                            'Error': str(e),
+                            'Timestamp': timestamp
+                        })
+                pending_instances.clear()
                 break
         
-        # Mark any remaining instances as timed out
-        for instance_id in pending_instances:
-            self.logger.warning(f"Instance {instance_id} verification timed out")
-            results['failed'].append({
-                'DBInstanceIdentifier': instance_id,
-                'Error': f'Verification timed out after {timeout} seconds',
-                'Timestamp': datetime.now().isoformat()
-            })
+        # Mark any remaining instances as timed out, in input order
+        timestamp = _now_iso()
+        for instance_id in instance_identifiers:
+            if instance_id in pending_instances:
+                self.logger.warning(f"Instance {instance_id} verification timed out")
+                results['failed'].append({
+                    'DBInstanceIdentifier': instance_id,
+                    'Error': f'Verification timed out after {timeout} seconds',
+                    'Timestamp': timestamp
+                })
         
         return results
\ No newline at end of file
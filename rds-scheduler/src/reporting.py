@@ -2,8 +2,273 @@ import csv
 import json
 import logging
 import os
+import string
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from tabulate import tabulate
+from itertools import islice, starmap
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
+# Result fields, in CSV report column order
+RESULT_FIELDS = ['Account', 'Region', 'ResourceType', 'ResourceId', 'PreviousState', 'NewState', 'Action', 'Timestamp', 'Status', 'Error']
+
+# Write buffer for report files, so large reports go out in few syscalls
+REPORT_BUFFER_SIZE = 1 << 20
+
+# Number of HTML table rows formatted and written together
+HTML_ROW_CHUNK_SIZE = 1024
+
+# Result statuses counted as successful operations
+_SUCCESS_STATUSES = frozenset(('Success', 'Verified', 'DryRun'))
+
+# HTML (class, icon) for each result status; other statuses are unstyled
+STATUS_STYLE = {
+    'Success': ('status-success', 'fas fa-check-circle'),
+    'Failed': ('status-failed', 'fas fa-times-circle'),
+    'Simulated': ('status-simulated', 'fas fa-flask')
+}
+
+# Account name substrings and the environment they indicate, checked in order
+ENVIRONMENT_NEEDLES = (
+    ('prod', 'production'),
+    ('staging', 'staging'),
+    ('stage', 'staging'),
+    ('dev', 'development'),
+    ('test', 'testing')
+)
+
+# Badge color class for each environment
+ENVIRONMENT_COLORS = {
+    'production': 'bg-danger',
+    'staging': 'bg-warning text-dark',
+    'development': 'bg-success',
+    'testing': 'bg-info',
+    'unknown': 'bg-secondary'
+}
+
+# HTML report page up to the summary cards, filled in with substitute()
+_HTML_HEADER = string.Template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>RDS Scheduler Report - ${title_time}</title>
+    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
+    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
+    <style>
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; }
+        .header { background: linear-gradient(135deg, #ffc107 0%, #fd7e14 100%); color: white; padding: 2rem 0; }
+        .summary-card { box-shadow: 0 0.125rem 0.25rem rgba(0, 0, 0, 0.075); }
+        .status-success { color: #198754; font-weight: bold; }
+        .status-failed { color: #dc3545; font-weight: bold; }
+        .status-simulated { color: #fd7e14; font-weight: bold; }
+        .resource-aurora { border-left: 4px solid #ffc107; }
+        .resource-rds { border-left: 4px solid #fd7e14; }
+        .footer { background-color: #f8f9fa; border-top: 1px solid #dee2e6; }
+        .timestamp { font-family: 'Courier New', monospace; font-size: 0.9rem; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <div class="container">
+            <div class="row align-items-center">
+                <div class="col-md-8">
+                    <h1 class="mb-0"><i class="fas fa-database me-2"></i>RDS Scheduler Report</h1>
+                    <p class="mb-0 mt-2">Generated on ${generated_on}</p>
+                </div>
+                <div class="col-md-4 text-md-end">
+                    <i class="fas fa-server fa-3x"></i>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <div class="container my-4">
+        """)
+
+# HTML report page between the summary cards and the results table rows
+_HTML_MIDDLE = """
+        
+        <div class="row mb-4">
+            <div class="col-md-6">
+                <div class="input-group">
+                    <span class="input-group-text"><i class="fas fa-search"></i></span>
+                    <input type="text" class="form-control" id="searchInput" placeholder="Search resources...">
+                </div>
+            </div>
+            <div class="col-md-6">
+                <select class="form-select" id="filterSelect">
+                    <option value="">All Resource Types</option>
+                    <option value="Aurora Cluster">Aurora Clusters</option>
+                    <option value="RDS Instance">RDS Instances</option>
+                </select>
+            </div>
+        </div>
+
+        <div class="row">
+            <div class="col-12">
+                <h2 class="mb-3"><i class="fas fa-table me-2"></i>Database Operations Detail</h2>
+                <div class="table-responsive">
+                    <table class="table table-hover" id="resultsTable">
+                        <thead class="table-dark">
+                            <tr>
+                                <th><i class="fas fa-cog me-1"></i>Type</th>
+                                <th><i class="fas fa-user-circle me-1"></i>Account</th>
+                                <th><i class="fas fa-globe me-1"></i>Region</th>
+                                <th><i class="fas fa-tag me-1"></i>Resource ID</th>
+                                <th><i class="fas fa-tags me-1"></i>Environment</th>
+                                <th><i class="fas fa-arrow-right me-1"></i>State Change</th>
+                                <th><i class="fas fa-play-circle me-1"></i>Action</th>
+                                <th><i class="fas fa-clock me-1"></i>Timestamp</th>
+                                <th><i class="fas fa-check-circle me-1"></i>Status</th>
+                                <th><i class="fas fa-exclamation-triangle me-1"></i>Error</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                            """
+
+# HTML report page after the results table rows
+_HTML_FOOTER = """
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <footer class="footer mt-5 py-3">
+        <div class="container">
+            <div class="row">
+                <div class="col-md-6">
+                    <small class="text-muted">
+                        <i class="fas fa-info-circle me-1"></i>
+                        Generated by RDS Scheduler v1.3
+                    </small>
+                </div>
+                <div class="col-md-6 text-md-end">
+                    <small class="text-muted">
+                        <i class="fas fa-download me-1"></i>
+                        Available as GitLab CI/CD Artifact
+                    </small>
+                </div>
+            </div>
+        </div>
+    </footer>
+
+    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
+    <script>
+        // Search and filter functionality
+        document.getElementById('searchInput').addEventListener('keyup', function() { filterTable(); });
+        document.getElementById('filterSelect').addEventListener('change', function() { filterTable(); });
+
+        function filterTable() {
+            const searchValue = document.getElementById('searchInput').value.toLowerCase();
+            const filterValue = document.getElementById('filterSelect').value;
+            const table = document.getElementById('resultsTable');
+            const rows = table.getElementsByTagName('tr');
+
+            for (let i = 1; i < rows.length; i++) {
+                const row = rows[i];
+                const cells = row.getElementsByTagName('td');
+                let showRow = true;
+
+                if (searchValue) {
+                    let found = false;
+                    for (let j = 0; j < cells.length; j++) {
+                        if (cells[j].textContent.toLowerCase().includes(searchValue)) {
+                            found = true;
+                            break;
+                        }
+                    }
+                    if (!found) showRow = false;
+                }
+
+                if (filterValue && showRow) {
+                    const typeCell = cells[0];
+                    if (!typeCell.textContent.includes(filterValue)) {
+                        showRow = false;
+                    }
+                }
+
+                row.style.display = showRow ? '' : 'none';
+            }
+        }
+    </script>
+</body>
+</html>
+            """
+
+# Row of the HTML results table, filled in with str.format
+_HTML_ROW_TEMPLATE = """
+            <tr class="{resource_class}">
+                <td><span class="badge bg-secondary">{resource_type}</span></td>
+                <td><strong>{account}</strong></td>
+                <td>{region}</td>
+                <td><code class="small">{resource_id}</code></td>
+                <td>{environment_tag}</td>
+                <td>
+            <span class="badge bg-light text-dark me-1">{previous_state}</span>
+            <i class="fas fa-arrow-right text-muted mx-1"></i>
+            <span class="badge bg-primary">{new_state}</span>
+            </td>
+                <td><span class="badge bg-info">{action}</span></td>
+                <td><span class="timestamp">{timestamp}</span></td>
+                <td><span class="{status_class}"><i class="{status_icon} me-1"></i>{status}</span></td>
+                <td><span class="text-danger small">{error}</span></td>
+            </tr>
+            """
+
+def _fit_width(value, width):
+    """Shorten a value to at most width characters, ending with an ellipsis if cut.
+    
+    Args:
+        value (str): Value to shorten
+        width (int): Maximum number of characters
+        
+    Returns:
+        str: Shortened value
+    """
+    return value if len(value) <= width else value[:width - 3] + '...'
+
+def _render_grid_table(headers, rows):
+    """Render rows as a fixed-width grid table.
+    
+    The borders and padding follow tabulate's 'grid' format, but every cell
+    is left-aligned and kept on one line: line breaks in a cell are replaced
+    with spaces. tabulate instead right-aligns numeric columns and splits
+    multi-line cells over several table lines.
+    
+    Args:
+        headers (list): Column headers
+        rows (list): Rows of string cells
+        
+    Returns:
+        str: Table as string
+    """
+    # Error messages can span lines, which would break the grid
+    rows = [[" ".join(cell.splitlines()) for cell in row] for row in rows]
+    
+    # Like tabulate, leave at least two spaces after each header
+    widths = [max(len(header) + 2, *map(len, column)) for header, column in zip(headers, zip(*rows))]
+    row_format = "| " + " | ".join(f"{{:<{width}}}" for width in widths) + " |"
+    separator = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+    
+    row_separator = f"\n{separator}\n"
+    
+    return "\n".join((
+        separator,
+        row_format.format(*headers),
+        separator.replace("-", "="),
+        row_separator.join(starmap(row_format.format, rows)),
+        separator
+    ))
 
 class ReportingError(Exception):
     """Exception raised for reporting errors."""
@@ -20,16 +285,25 @@ class Reporter:
         """
         self.logger = logging.getLogger(__name__)
         self.reports_dir = reports_dir
-        self.results = []
+        # Results are stored column-major: one list per field in RESULT_FIELDS
+        self._columns = {field: [] for field in RESULT_FIELDS}
+        # Summary statistics, computed on first use and reset when results change
+        self._stats_cache = None
+        # Summary text built from the cached stats, reset along with them
+        self._summary_text_cache = None
+        # Read-only result mappings handed out by the results property, reset along with them
+        self._results_cache = None
+        # Environment badge HTML by account name, shared by every row of an account
+        self._env_for_account = {}
+        # Accounts may be processed concurrently, so guard result updates
+        self._lock = threading.Lock()
         
         # Create reports directory if it doesn't exist
-        if not os.path.exists(reports_dir):
-            try:
-                os.makedirs(reports_dir)
-                self.logger.info(f"Created reports directory: {reports_dir}")
-            except Exception as e:
-                self.logger.error(f"Failed to create reports directory: {str(e)}")
-                raise ReportingError(f"Failed to create reports directory: {str(e)}")
+        try:
+            os.makedirs(reports_dir, exist_ok=True)
+        except OSError as e:
+            self.logger.error(f"Failed to create reports directory: {str(e)}")
+            raise ReportingError(f"Failed to create reports directory: {str(e)}")
     
     def add_result(self, account, region, resource_type, resource_id, previous_state, new_state, action, timestamp, status, error=None):
         """Add a result to the report.
@@ -46,21 +320,68 @@ class Reporter:
             status (str): Status of action
             error (str, optional): Error message if any
         """
-        result = {
-            'Account': account,
-            'Region': region,
-            'ResourceType': resource_type,
-            'ResourceId': resource_id,
-            'PreviousState': previous_state,
-            'NewState': new_state,
-            'Action': action,
-            'Timestamp': timestamp,
-            'Status': status,
-            'Error': error or ''
-        }
-        self.results.append(result)
+        values = (account, region, resource_type, resource_id, previous_state, new_state,
+                  action, timestamp, status, error or '')
+        with self._lock:
+            for column, value in zip(self._columns.values(), values):
+                column.append(value)
+            self._stats_cache = None
+            self._summary_text_cache = None
+            self._results_cache = None
         self.logger.debug(f"Added result: {resource_type} {resource_id} - {action} - {status}")
     
+    def extend_results(self, results):
+        """Add several results to the report at once.
+        
+        Args:
+            results (iterable): Result dictionaries with the same keys add_result
+                produces (Account, Region, ResourceType, ResourceId,
+                PreviousState, NewState, Action, Timestamp, Status, Error)
+                
+        Raises:
+            KeyError: If a result is missing a field; no results are added then
+        """
+        # Read every value before touching the columns, so a bad row cannot
+        # leave some columns extended and others not
+        values = [tuple(result[field] for field in RESULT_FIELDS) for result in results]
+        
+        with self._lock:
+            for column, field_values in zip(self._columns.values(), zip(*values)):
+                column.extend(field_values)
+            self._stats_cache = None
+            self._summary_text_cache = None
+            self._results_cache = None
+        self.logger.debug(f"Added {len(values)} results")
+    
+    @property
+    def result_count(self):
+        """int: Number of results added so far."""
+        return len(self._columns['Account'])
+    
+    @property
+    def results(self):
+        """tuple: Read-only view of the results, as mappings keyed by RESULT_FIELDS.
+        
+        Results are stored by column, so this view is built on first access
+        and cached until results change. It cannot be modified; use
+        add_result or extend_results to add results and result_count to
+        count them.
+        """
+        results = self._results_cache
+        if results is None:
+            results = self._results_cache = tuple(
+                MappingProxyType(dict(zip(RESULT_FIELDS, row))) for row in self._rows()
+            )
+        return results
+    
+    def _rows(self):
+        """Iterate over results as tuples in RESULT_FIELDS order.
+        
+        Returns:
+            iterator: Result tuples
+        """
+        return zip(*self._columns.values())
+    
     def generate_csv_report(self):
         """Generate CSV report.
         
@@ -68,20 +389,18 @@ class Reporter:
             str: Path to generated CSV file
         """
         try:
-            if not self.results:
+            if not self.result_count:
                 self.logger.warning("No results to generate CSV report")
                 return None
                 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"{self.reports_dir}/rds_scheduler_report_{timestamp}.csv"
             
-            fieldnames = ['Account', 'Region', 'ResourceType', 'ResourceId', 'PreviousState', 'NewState', 'Action', 'Timestamp', 'Status', 'Error']
-            
-            with open(filename, 'w', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                for result in self.results:
-                    writer.writerow(result)
+            with open(filename, 'w', newline='', buffering=REPORT_BUFFER_SIZE) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(RESULT_FIELDS)
+                writer.writerows(self._rows())
                     
             self.logger.info(f"CSV report generated: {filename}")
             return filename
@@ -97,22 +416,27 @@ class Reporter:
             str: Path to generated JSON file
         """
         try:
-            if not self.results:
+            if not self.result_count:
                 self.logger.warning("No results to generate JSON report")
                 return None
                 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"{self.reports_dir}/rds_scheduler_report_{timestamp}.json"
             
             report_data = {
-                'generated_at': datetime.now().isoformat(),
-                'total_results': len(self.results),
+                'generated_at': now.isoformat(),
+                'total_results': self.result_count,
                 'summary': self._generate_summary_stats(),
-                'results': self.results
+                'results': [dict(zip(RESULT_FIELDS, row)) for row in self._rows()]
             }
             
-            with open(filename, 'w') as jsonfile:
-                json.dump(report_data, jsonfile, indent=2)
+            if orjson is not None:
+                with open(filename, 'wb') as jsonfile:
+                    jsonfile.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(filename, 'w', buffering=REPORT_BUFFER_SIZE) as jsonfile:
+                    json.dump(report_data, jsonfile, indent=2)
                 
             self.logger.info(f"JSON report generated: {filename}")
             return filename
@@ -128,43 +452,27 @@ class Reporter:
             str: Table as string
         """
         try:
-            if not self.results:
+            if not self.result_count:
                 return "No results to display"
                 
             headers = ['Account', 'Region', 'Resource Type', 'Resource ID', 'Previous State', 'New State', 'Action', 'Status', 'Error']
-            rows = []
+            # Truncate long resource IDs and error messages for better table formatting
+            rows = [
+                [account, region, resource_type, _fit_width(resource_id, 25), previous_state,
+                 new_state, action, status, _fit_width(error, 30)]
+                for (account, region, resource_type, resource_id, previous_state, new_state,
+                     action, _, status, error) in self._rows()
+            ]
             
-            for result in self.results:
-                # Truncate long resource IDs for better table formatting
-                resource_id = result['ResourceId']
-                if len(resource_id) > 25:
-                    resource_id = resource_id[:22] + "..."
-                    
-                # Truncate error messages
-                error = result['Error']
-                if len(error) > 30:
-                    error = error[:27] + "..."
-                
-                rows.append([
-                    result['Account'],
-                    result['Region'],
-                    result['ResourceType'],
-                    resource_id,
-                    result['PreviousState'],
-                    result['NewState'],
-                    result['Action'],
-                    result['Status'],
-                    error
-                ])
-            
-            table = tabulate(rows, headers=headers, tablefmt='grid')
+            table = _render_grid_table(headers, rows)
             
             # Save table to file
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"{self.reports_dir}/rds_scheduler_report_{timestamp}.txt"
             
-            with open(filename, 'w') as txtfile:
-                txtfile.write(f"RDS Scheduler Report - Generated at {datetime.now().isoformat()}\n")
+            with open(filename, 'w', buffering=REPORT_BUFFER_SIZE) as txtfile:
+                txtfile.write(f"RDS Scheduler Report - Generated at {now.isoformat()}\n")
                 txtfile.write("=" * 80 + "\n\n")
                 txtfile.write(self._generate_summary_text())
                 txtfile.write("\n\nDetailed Results:\n")
@@ -177,71 +485,100 @@ class Reporter:
             self.logger.error(f"Failed to generate table report: {str(e)}")
             raise ReportingError(f"Failed to generate table report: {str(e)}")
     
+    def generate_all_reports(self):
+        """Generate the CSV, JSON, table and HTML reports concurrently.
+        
+        Returns:
+            dict: Generated reports keyed by format ('csv', 'json', 'table', 'html');
+                the table entry is the table text, the others are file paths
+        """
+        # Compute the shared summary stats once, before the reports race for them
+        self._generate_summary_stats()
+        
+        # Each report writes its own file, so generate them concurrently
+        generators = {
+            'csv': self.generate_csv_report,
+            'json': self.generate_json_report,
+            'table': self.generate_table_report,
+            'html': self.generate_html_report
+        }
+        with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+            futures = {name: executor.submit(generator) for name, generator in generators.items()}
+        
+        return {name: future.result() for name, future in futures.items()}
+    
     def generate_summary(self):
         """Generate a summary of results.
         
         Returns:
             str: Summary text
         """
-        if not self.results:
+        if not self.result_count:
             return "No operations performed"
             
         return self._generate_summary_text()
     
     def _generate_summary_stats(self):
-        """Generate summary statistics.
+        """Generate summary statistics, reusing them until results change.
         
         Returns:
             dict: Summary statistics
         """
-        if not self.results:
+        # Reports may be generated concurrently, so compute under the lock
+        with self._lock:
+            if self._stats_cache is None:
+                self._stats_cache = self._compute_summary_stats()
+            return self._stats_cache
+    
+    def _compute_summary_stats(self):
+        """Compute summary statistics over all results.
+        
+        Returns:
+            dict: Summary statistics
+        """
+        if not self.result_count:
             return {}
             
+        # Counter keeps first-seen order, matching the previous row-by-row counts
+        status_counts = Counter(self._columns['Status'])
+        
         stats = {
-            'total_operations': len(self.results),
-            'successful_operations': len([r for r in self.results if r['Status'] in ['Success', 'Verified', 'DryRun']]),
-            'failed_operations': len([r for r in self.results if r['Status'] == 'Failed']),
-            'by_resource_type': {},
-            'by_action': {},
-            'by_account': {},
-            'by_region': {}
+            'total_operations': self.result_count,
+            'successful_operations': sum(status_counts[status] for status in _SUCCESS_STATUSES),
+            'failed_operations': status_counts['Failed'],
+            'by_resource_type': dict(Counter(self._columns['ResourceType'])),
+            'by_action': dict(Counter(self._columns['Action'])),
+            'by_account': dict(Counter(self._columns['Account'])),
+            'by_region': dict(Counter(self._columns['Region']))
         }
         
-        for result in self.results:
-            # Count by resource type
-            resource_type = result['ResourceType']
-            if resource_type not in stats['by_resource_type']:
-                stats['by_resource_type'][resource_type] = 0
-            stats['by_resource_type'][resource_type] += 1
-            
-            # Count by action
-            action = result['Action']
-            if action not in stats['by_action']:
-                stats['by_action'][action] = 0
-            stats['by_action'][action] += 1
-            
-            # Count by account
-            account = result['Account']
-            if account not in stats['by_account']:
-                stats['by_account'][account] = 0
-            stats['by_account'][account] += 1
-            
-            # Count by region
-            region = result['Region']
-            if region not in stats['by_region']:
-                stats['by_region'][region] = 0
-            stats['by_region'][region] += 1
-        
         return stats
     
     def _generate_summary_text(self):
-        """Generate summary text.
+        """Generate summary text, reusing it until results change.
         
         Returns:
             str: Summary as text
         """
-        stats = self._generate_summary_stats()
+        text = self._summary_text_cache
+        if text is None:
+            stats = self._generate_summary_stats()
+            text = self._compute_summary_text(stats)
+            with self._lock:
+                # Only keep the text if no results arrived while it was built
+                if self._stats_cache is stats:
+                    self._summary_text_cache = text
+        return text
+    
+    def _compute_summary_text(self, stats):
+        """Build summary text from summary statistics.
         
+        Args:
+            stats (dict): Summary statistics
+            
+        Returns:
+            str: Summary as text
+        """
         if not stats:
             return "No operations performed"
         
@@ -275,158 +612,24 @@ class Reporter:
             str: Path to the generated HTML file
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            if not self.result_count:
+                self.logger.warning("No results to generate HTML report")
+                return None
+                
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"{self.reports_dir}/rds_scheduler_report_{timestamp}.html"
             
-            # HTML template with Bootstrap styling
-            html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>RDS Scheduler Report - {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-    <style>
-        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; }}
-        .header {{ background: linear-gradient(135deg, #ffc107 0%, #fd7e14 100%); color: white; padding: 2rem 0; }}
-        .summary-card {{ box-shadow: 0 0.125rem 0.25rem rgba(0, 0, 0, 0.075); }}
-        .status-success {{ color: #198754; font-weight: bold; }}
-        .status-failed {{ color: #dc3545; font-weight: bold; }}
-        .status-simulated {{ color: #fd7e14; font-weight: bold; }}
-        .resource-aurora {{ border-left: 4px solid #ffc107; }}
-        .resource-rds {{ border-left: 4px solid #fd7e14; }}
-        .footer {{ background-color: #f8f9fa; border-top: 1px solid #dee2e6; }}
-        .timestamp {{ font-family: 'Courier New', monospace; font-size: 0.9rem; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <div class="container">
-            <div class="row align-items-center">
-                <div class="col-md-8">
-                    <h1 class="mb-0"><i class="fas fa-database me-2"></i>RDS Scheduler Report</h1>
-                    <p class="mb-0 mt-2">Generated on {datetime.now().strftime("%Y-%m-%d at %H:%M:%S UTC")}</p>
-                </div>
-                <div class="col-md-4 text-md-end">
-                    <i class="fas fa-server fa-3x"></i>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <div class="container my-4">
-        {self._generate_rds_summary_cards()}
-        
-        <div class="row mb-4">
-            <div class="col-md-6">
-                <div class="input-group">
-                    <span class="input-group-text"><i class="fas fa-search"></i></span>
-                    <input type="text" class="form-control" id="searchInput" placeholder="Search resources...">
-                </div>
-            </div>
-            <div class="col-md-6">
-                <select class="form-select" id="filterSelect">
-                    <option value="">All Resource Types</option>
-                    <option value="Aurora Cluster">Aurora Clusters</option>
-                    <option value="RDS Instance">RDS Instances</option>
-                </select>
-            </div>
-        </div>
-
-        <div class="row">
-            <div class="col-12">
-                <h2 class="mb-3"><i class="fas fa-table me-2"></i>Database Operations Detail</h2>
-                <div class="table-responsive">
-                    <table class="table table-hover" id="resultsTable">
-                        <thead class="table-dark">
-                            <tr>
-                                <th><i class="fas fa-cog me-1"></i>Type</th>
-                                <th><i class="fas fa-user-circle me-1"></i>Account</th>
-                                <th><i class="fas fa-globe me-1"></i>Region</th>
-                                <th><i class="fas fa-tag me-1"></i>Resource ID</th>
-                                <th><i class="fas fa-tags me-1"></i>Environment</th>
-                                <th><i class="fas fa-arrow-right me-1"></i>State Change</th>
-                                <th><i class="fas fa-play-circle me-1"></i>Action</th>
-                                <th><i class="fas fa-clock me-1"></i>Timestamp</th>
-                                <th><i class="fas fa-check-circle me-1"></i>Status</th>
-                                <th><i class="fas fa-exclamation-triangle me-1"></i>Error</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                            {self._generate_rds_table_rows()}
-                        </tbody>
-                    </table>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <footer class="footer mt-5 py-3">
-        <div class="container">
-            <div class="row">
-                <div class="col-md-6">
-                    <small class="text-muted">
-                        <i class="fas fa-info-circle me-1"></i>
-                        Generated by RDS Scheduler v1.3
-                    </small>
-                </div>
-                <div class="col-md-6 text-md-end">
-                    <small class="text-muted">
-                        <i class="fas fa-download me-1"></i>
-                        Available as GitLab CI/CD Artifact
-                    </small>
-                </div>
-            </div>
-        </div>
-    </footer>
-
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-    <script>
-        // Search and filter functionality
-        document.getElementById('searchInput').addEventListener('keyup', function() {{ filterTable(); }});
-        document.getElementById('filterSelect').addEventListener('change', function() {{ filterTable(); }});
-
-        function filterTable() {{
-            const searchValue = document.getElementById('searchInput').value.toLowerCase();
-            const filterValue = document.getElementById('filterSelect').value;
-            const table = document.getElementById('resultsTable');
-            const rows = table.getElementsByTagName('tr');
-
-            for (let i = 1; i < rows.length; i++) {{
-                const row = rows[i];
-                const cells = row.getElementsByTagName('td');
-                let showRow = true;
-
-                if (searchValue) {{
-                    let found = false;
-                    for (let j = 0; j < cells.length; j++) {{
-                        if (cells[j].textContent.toLowerCase().includes(searchValue)) {{
-                            found = true;
-                            break;
-                        }}
-                    }}
-                    if (!found) showRow = false;
-                }}
-
-                if (filterValue && showRow) {{
-                    const typeCell = cells[0];
-                    if (!typeCell.textContent.includes(filterValue)) {{
-                        showRow = false;
-                    }}
-                }}
-
-                row.style.display = showRow ? '' : 'none';
-            }}
-        }}
-    </script>
-</body>
-</html>
-            """
-            
-            with open(filename, 'w', encoding='utf-8') as htmlfile:
-                htmlfile.write(html_content)
+            with open(filename, 'w', encoding='utf-8', buffering=REPORT_BUFFER_SIZE) as htmlfile:
+                # Stream the page so the table rows are never joined into one string
+                htmlfile.write(_HTML_HEADER.substitute(
+                    title_time=now.strftime("%Y-%m-%d %H:%M:%S"),
+                    generated_on=now.strftime("%Y-%m-%d at %H:%M:%S UTC")
+                ))
+                htmlfile.write(self._generate_rds_summary_cards())
+                htmlfile.write(_HTML_MIDDLE)
+                self._write_rds_table_rows(htmlfile)
+                htmlfile.write(_HTML_FOOTER)
                 
             self.logger.info(f"HTML report generated: {filename}")
             return filename
@@ -437,13 +640,18 @@ class Reporter:
 
     def _generate_rds_summary_cards(self):
         """Generate RDS-specific summary cards."""
-        total = len(self.results)
-        successful = sum(1 for r in self.results if r['Status'] == 'Success')
-        failed = sum(1 for r in self.results if r['Status'] == 'Failed')
-        simulated = sum(1 for r in self.results if r['Status'] == 'Simulated')
+        # Cards count only 'Success' as successful, unlike the summary stats
+        status_counts = Counter(self._columns['Status'])
+        total = self.result_count
+        successful = status_counts['Success']
+        failed = status_counts['Failed']
+        simulated = status_counts['Simulated']
         
-        aurora_count = sum(1 for r in self.results if 'Aurora' in r['ResourceType'])
-        rds_count = sum(1 for r in self.results if 'RDS' in r['ResourceType'])
+        # Group the distinct resource types from the cached stats rather
+        # than scanning every result
+        by_resource_type = self._generate_summary_stats().get('by_resource_type', {})
+        aurora_count = sum(count for resource_type, count in by_resource_type.items() if 'Aurora' in resource_type)
+        rds_count = sum(count for resource_type, count in by_resource_type.items() if 'RDS' in resource_type)
         
         return f"""
         <div class="row mb-4">
@@ -499,72 +707,52 @@ class Reporter:
         </div>
         """
 
-    def _generate_rds_table_rows(self):
-        """Generate HTML table rows for RDS results."""
-        rows = []
+    def _write_rds_table_rows(self, htmlfile):
+        """Write the HTML table rows in chunks of HTML_ROW_CHUNK_SIZE results.
         
-        for result in self.results:
-            resource_class = "resource-aurora" if "Aurora" in result['ResourceType'] else "resource-rds"
-            
-            status_class = ""
-            status_icon = ""
-            if result['Status'] == 'Success':
-                status_class, status_icon = "status-success", "fas fa-check-circle"
-            elif result['Status'] == 'Failed':
-                status_class, status_icon = "status-failed", "fas fa-times-circle"
-            elif result['Status'] == 'Simulated':
-                status_class, status_icon = "status-simulated", "fas fa-flask"
-            
-            environment_tag = self._extract_rds_environment_tag(result)
-            
-            state_change = f"""
-            <span class="badge bg-light text-dark me-1">{result['PreviousState']}</span>
-            <i class="fas fa-arrow-right text-muted mx-1"></i>
-            <span class="badge bg-primary">{result['NewState']}</span>
-            """
-            
-            timestamp_formatted = result['Timestamp'][:16] if result['Timestamp'] else 'N/A'
-            
-            row = f"""
-            <tr class="{resource_class}">
-                <td><span class="badge bg-secondary">{result['ResourceType']}</span></td>
-                <td><strong>{result['Account']}</strong></td>
-                <td>{result['Region']}</td>
-                <td><code class="small">{result['ResourceId'][:25]}{'...' if len(result['ResourceId']) > 25 else ''}</code></td>
-                <td>{environment_tag}</td>
-                <td>{state_change}</td>
-                <td><span class="badge bg-info">{result['Action'].title()}</span></td>
-                <td><span class="timestamp">{timestamp_formatted}</span></td>
-                <td><span class="{status_class}"><i class="{status_icon} me-1"></i>{result['Status']}</span></td>
-                <td><span class="text-danger small">{result['Error'][:30]}{'...' if len(result['Error']) > 30 else ''}</span></td>
-            </tr>
-            """
-            rows.append(row)
+        Args:
+            htmlfile (file): Open HTML report file
+        """
+        rows = self._rows()
+        while True:
+            chunk = list(islice(rows, HTML_ROW_CHUNK_SIZE))
+            if not chunk:
+                break
+            htmlfile.write("".join(starmap(self._format_rds_table_row, chunk)))
+    
+    def _format_rds_table_row(self, account, region, resource_type, resource_id, previous_state,
+                              new_state, action, timestamp, status, error):
+        """Format one result as an HTML table row."""
+        status_class, status_icon = STATUS_STYLE.get(status, ('', ''))
         
-        return "".join(rows)
+        return _HTML_ROW_TEMPLATE.format(
+            resource_class="resource-aurora" if "Aurora" in resource_type else "resource-rds",
+            resource_type=resource_type,
+            account=account,
+            region=region,
+            resource_id=_fit_width(resource_id, 25),
+            environment_tag=self._extract_rds_environment_tag(account),
+            previous_state=previous_state,
+            new_state=new_state,
+            action=action.title(),
+            timestamp=timestamp[:16] if timestamp else 'N/A',
+            status_class=status_class,
+            status_icon=status_icon,
+            status=status,
+            error=_fit_width(error, 30)
+        )
     
-    def _extract_rds_environment_tag(self, result):
-        """Extract environment tag for RDS resources."""
-        environment = "Unknown"
-        
-        # Check account name for environment
-        account = result.get('Account', '').lower()
-        if 'prod' in account:
-            environment = "production"
-        elif 'staging' in account or 'stage' in account:
-            environment = "staging"
-        elif 'dev' in account:
-            environment = "development"
-        elif 'test' in account:
-            environment = "testing"
-        
-        env_colors = {
-            'production': 'bg-danger',
-            'staging': 'bg-warning text-dark',
-            'development': 'bg-success',
-            'testing': 'bg-info',
-            'unknown': 'bg-secondary'
-        }
+    def _extract_rds_environment_tag(self, account):
+        """Extract environment tag for RDS resources from the account name."""
+        tag = self._env_for_account.get(account)
+        if tag is None:
+            tag = self._env_for_account[account] = self._build_environment_tag(account)
+        return tag
+    
+    def _build_environment_tag(self, account):
+        """Build the environment badge HTML for an account name."""
+        account = (account or '').lower()
+        environment = next((env for needle, env in ENVIRONMENT_NEEDLES if needle in account), 'unknown')
         
-        color_class = env_colors.get(environment.lower(), 'bg-secondary')
+        color_class = ENVIRONMENT_COLORS.get(environment, 'bg-secondary')
         return f'<span class="badge {color_class}">{environment.title()}</span>' 
\ No newline at end of file
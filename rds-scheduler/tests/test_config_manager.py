@@ -0,0 +1,145 @@
+# tests/test_config_manager.py
+import os
+import json
+import pytest
+import tempfile
+from src.config_manager import ConfigManager
+
+def write_accounts(path, accounts):
+    with open(path, 'w') as f:
+        json.dump({'accounts': accounts}, f)
+
+class TestConfigManager:
+    
+    def test_get_accounts_keeps_every_match_in_file_order(self):
+        """Test filtering accounts by name returns duplicate names in file order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = os.path.join(tmpdir, "config.ini")
+            accounts_file = os.path.join(tmpdir, "accounts.json")
+            write_accounts(accounts_file, [
+                {'name': 'prod', 'account_id': '1', 'region': 'us-east-1'},
+                {'name': 'dev', 'account_id': '2'},
+                {'name': 'prod', 'account_id': '1', 'region': 'eu-west-1'}
+            ])
+            
+            config_manager = ConfigManager(config_file, accounts_file)
+            
+            prod = config_manager.get_accounts(['prod'])
+            assert [acc['region'] for acc in prod] == ['us-east-1', 'eu-west-1']
+            
+            both = config_manager.get_accounts(['dev', 'prod'])
+            assert [acc['account_id'] for acc in both] == ['1', '2', '1']
+    
+    def test_modified_files_are_reloaded(self):
+        """Test that a cached config or accounts file is re-read after it changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = os.path.join(tmpdir, "config.ini")
+            accounts_file = os.path.join(tmpdir, "accounts.json")
+            with open(config_file, 'w') as f:
+                f.write("[aws]\ntag_key = Team\n")
+            write_accounts(accounts_file, [{'name': 'prod', 'account_id': '1'}])
+            
+            assert ConfigManager(config_file, accounts_file).get_tag_config() == ('Team', 'enabled')
+            assert ConfigManager(config_file, accounts_file).get_tag_config() == ('Team', 'enabled')
+            
+            with open(config_file, 'w') as f:
+                f.write("[aws]\ntag_key = Schedule-Override\n")
+            write_accounts(accounts_file, [{'name': 'prod', 'account_id': '1'}, {'name': 'dev', 'account_id': '2'}])
+            
+            config_manager = ConfigManager(config_file, accounts_file)
+            assert config_manager.get_tag_config() == ('Schedule-Override', 'enabled')
+            assert len(config_manager.get_accounts()) == 2
+    
+    def test_cached_files_are_not_shared_between_instances(self):
+        """Test that changes through one instance never reach another reading the same files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = os.path.join(tmpdir, "config.ini")
+            accounts_file = os.path.join(tmpdir, "accounts.json")
+            with open(config_file, 'w') as f:
+                f.write("[aws]\nregion = us-east-2\n")
+            write_accounts(accounts_file, [{'name': 'prod', 'account_id': '1'}])
+            
+            first = ConfigManager(config_file, accounts_file)
+            first.config.set('aws', 'region', 'eu-west-1')
+            first.get_accounts().append({'name': 'dev', 'account_id': '2'})
+            first.get_accounts(['prod'])[0]['account_id'] = '3'
+            
+            assert first.get_accounts() == [{'name': 'prod', 'account_id': '1'}]
+            
+            second = ConfigManager(config_file, accounts_file)
+            assert second.config.get('aws', 'region') == 'us-east-2'
+            assert second.get_accounts() == [{'name': 'prod', 'account_id': '1'}]
+    
+    def test_getters_read_config_values(self):
+        """Test getters return configured values and fall back to defaults."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = os.path.join(tmpdir, "config.ini")
+            accounts_file = os.path.join(tmpdir, "accounts.json")
+            with open(config_file, 'w') as f:
+                f.write("[aws]\nregion = us-east-2\n\n[logging]\nlevel = DEBUG\n")
+            
+            config_manager = ConfigManager(config_file, accounts_file)
+            
+            assert config_manager.get_log_config() == {'level': 'DEBUG', 'file': 'rds-scheduler.log'}
+            assert config_manager.get('aws', 'region') == 'us-east-2'
+            assert config_manager.get('aws', 'missing', fallback='default') == 'default'
+            assert config_manager.get('missing', 'region') is None
+    
+    def test_literal_percent_does_not_fail_load(self):
+        """Test a value with a bare '%' loads as written and other values still interpolate."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = os.path.join(tmpdir, "config.ini")
+            accounts_file = os.path.join(tmpdir, "accounts.json")
+            with open(config_file, 'w') as f:
+                f.write("[aws]\nregion = us-east-2\n\n[logging]\nlevel = DEBUG\n"
+                        "file = logs/rds-%Y%m%d.log\nformat = 100%%\n")
+            
+            config_manager = ConfigManager(config_file, accounts_file)
+            
+            assert config_manager.get_log_config()['file'] == 'logs/rds-%Y%m%d.log'
+            assert config_manager.get('logging', 'format') == '100%'
+    
+    def test_get_is_case_insensitive_for_keys(self):
+        """Test get() matches option names the way ConfigParser does."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = os.path.join(tmpdir, "config.ini")
+            accounts_file = os.path.join(tmpdir, "accounts.json")
+            with open(config_file, 'w') as f:
+                f.write("[aws]\nRegion = us-east-2\n")
+            
+            config_manager = ConfigManager(config_file, accounts_file)
+            
+            assert config_manager.get('aws', 'Region') == 'us-east-2'
+            assert config_manager.get('aws', 'region') == 'us-east-2'
+    
+    def test_get_rds_config_converts_ints(self):
+        """Test RDS settings are converted to ints, with defaults for missing keys."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = os.path.join(tmpdir, "config.ini")
+            accounts_file = os.path.join(tmpdir, "accounts.json")
+            with open(config_file, 'w') as f:
+                f.write("[rds]\ncluster_check_interval = 45\n")
+            
+            config_manager = ConfigManager(config_file, accounts_file)
+            rds_config = config_manager.get_rds_config()
+            
+            assert rds_config['engine_filter'] == 'aurora-postgresql'
+            assert rds_config['cluster_check_interval'] == 45
+            assert rds_config['cluster_verification_timeout'] == 600
+            assert rds_config['instance_check_interval'] == 15
+    
+    def test_malformed_rds_setting_only_fails_get_rds_config(self):
+        """Test a bad [rds] value does not break the other config getters."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = os.path.join(tmpdir, "config.ini")
+            accounts_file = os.path.join(tmpdir, "accounts.json")
+            with open(config_file, 'w') as f:
+                f.write("[aws]\nregion = us-east-1\n\n[rds]\ncluster_check_interval = 30s\n")
+            
+            config_manager = ConfigManager(config_file, accounts_file)
+            
+            assert config_manager.get_tag_config() == ('Schedule', 'enabled')
+            assert config_manager.get_log_config()['level'] == 'INFO'
+            
+            with pytest.raises(ValueError):
+                config_manager.get_rds_config()
@@ -0,0 +1,214 @@
+# tests/test_rds_operations.py
+import pytest
+import botocore.exceptions
+from unittest.mock import patch, MagicMock
+from src.rds_operations import RDSOperations, RDSOperationError, VERIFY_BATCH_SIZE, _chunked
+
+def make_clients(mock_session):
+    """Wire mocked RDS and tagging clients into the patched shared session."""
+    mock_rds = MagicMock()
+    mock_tagging = MagicMock()
+    mock_session.client.side_effect = lambda service, **kwargs: mock_rds if service == 'rds' else mock_tagging
+    
+    # Hand out one paginator mock per describe operation
+    paginators = {name: MagicMock() for name in ('describe_db_clusters', 'describe_db_instances')}
+    mock_rds.get_paginator.side_effect = paginators.__getitem__
+    return mock_rds, mock_tagging, paginators
+
+def cluster(cluster_id, status='available'):
+    return {
+        'DBClusterIdentifier': cluster_id,
+        'DBClusterArn': f'arn:aws:rds:us-west-2:123456789012:cluster:{cluster_id}',
+        'Status': status,
+        'Engine': 'aurora-postgresql',
+        'DBClusterMembers': []
+    }
+
+def describe_clusters_pages(clusters):
+    """Paginate side effect returning the clusters matching a db-cluster-id filter."""
+    def paginate(Filters=(), **kwargs):
+        ids = next((f['Values'] for f in Filters if f['Name'] == 'db-cluster-id'), None)
+        return [{'DBClusters': [c for c in clusters if ids is None or c['DBClusterIdentifier'] in ids]}]
+    return paginate
+
+class TestRDSOperations:
+    
+    @patch('src.rds_operations._SESSION')
+    def test_find_tagged_clusters_uses_tagging_api(self, mock_session):
+        """Test finding clusters through the Resource Groups Tagging API."""
+        mock_rds, mock_tagging, paginators = make_clients(mock_session)
+        clusters = [cluster('aurora-1'), cluster('aurora-2')]
+        
+        mock_tagging.get_paginator.return_value.paginate.return_value = [
+            {'ResourceTagMappingList': [{'ResourceARN': clusters[0]['DBClusterArn']}]}
+        ]
+        paginators['describe_db_clusters'].paginate.side_effect = describe_clusters_pages(clusters)
+        
+        rds_ops = RDSOperations('us-west-2')
+        found = rds_ops.find_tagged_clusters('Schedule', 'enabled')
+        
+        # Tag matching happens server-side
+        mock_tagging.get_paginator.return_value.paginate.assert_called_once()
+        assert mock_tagging.get_paginator.return_value.paginate.call_args.kwargs['TagFilters'] == [
+            {'Key': 'Schedule', 'Values': ['enabled']}
+        ]
+        mock_rds.list_tags_for_resource.assert_not_called()
+        
+        assert [c['DBClusterIdentifier'] for c in found] == ['aurora-1']
+    
+    @patch('src.rds_operations._SESSION')
+    def test_find_tagged_clusters_falls_back_on_access_denied(self, mock_session):
+        """Test falling back to ListTagsForResource when tag:GetResources is denied."""
+        mock_rds, mock_tagging, paginators = make_clients(mock_session)
+        clusters = [cluster('aurora-1'), cluster('aurora-2'), cluster('aurora-3')]
+        tags = {
+            clusters[0]['DBClusterArn']: [{'Key': 'Schedule', 'Value': 'enabled'}],
+            clusters[1]['DBClusterArn']: [{'Key': 'Schedule', 'Value': 'disabled'}],
+            clusters[2]['DBClusterArn']: [{'Key': 'Owner', 'Value': 'team'},
+                                          {'Key': 'Schedule', 'Value': 'enabled'}]
+        }
+        
+        mock_tagging.get_paginator.return_value.paginate.side_effect = botocore.exceptions.ClientError(
+            {'Error': {'Code': 'AccessDeniedException', 'Message': 'Not authorized'}},
+            'GetResources'
+        )
+        paginators['describe_db_clusters'].paginate.side_effect = describe_clusters_pages(clusters)
+        mock_rds.list_tags_for_resource.side_effect = lambda ResourceName: {'TagList': tags[ResourceName]}
+        
+        rds_ops = RDSOperations('us-west-2')
+        found = rds_ops.find_tagged_clusters('Schedule', 'enabled')
+        
+        # Every cluster's tags are listed, and only matching clusters are returned
+        assert mock_rds.list_tags_for_resource.call_count == 3
+        assert [c['DBClusterIdentifier'] for c in found] == ['aurora-1', 'aurora-3']
+    
+    @patch('src.rds_operations._SESSION')
+    def test_find_tagged_instances_fallback_skips_cluster_members(self, mock_session):
+        """Test the ListTagsForResource fallback does not look up tags of Aurora cluster members."""
+        mock_rds, mock_tagging, paginators = make_clients(mock_session)
+        instances = [
+            {'DBInstanceIdentifier': 'db-1', 'DBInstanceArn': 'arn:aws:rds:us-west-2:123456789012:db:db-1',
+             'DBInstanceStatus': 'available', 'Engine': 'postgres'},
+            {'DBInstanceIdentifier': 'aurora-1-a', 'DBInstanceArn': 'arn:aws:rds:us-west-2:123456789012:db:aurora-1-a',
+             'DBInstanceStatus': 'available', 'Engine': 'aurora-postgresql', 'DBClusterIdentifier': 'aurora-1'}
+        ]
+        
+        mock_tagging.get_paginator.return_value.paginate.side_effect = botocore.exceptions.ClientError(
+            {'Error': {'Code': 'AccessDeniedException', 'Message': 'Not authorized'}},
+            'GetResources'
+        )
+        paginators['describe_db_instances'].paginate.return_value = [{'DBInstances': instances}]
+        mock_rds.list_tags_for_resource.return_value = {'TagList': [{'Key': 'Schedule', 'Value': 'enabled'}]}
+        
+        rds_ops = RDSOperations('us-west-2')
+        found = rds_ops.find_tagged_instances('Schedule', 'enabled')
+        
+        mock_rds.list_tags_for_resource.assert_called_once_with(ResourceName=instances[0]['DBInstanceArn'])
+        assert [i['DBInstanceIdentifier'] for i in found] == ['db-1']
+    
+    @patch('src.rds_operations._SESSION')
+    def test_find_tagged_clusters_other_errors_are_raised(self, mock_session):
+        """Test that tagging API errors other than access denied are not swallowed."""
+        mock_rds, mock_tagging, paginators = make_clients(mock_session)
+        
+        mock_tagging.get_paginator.return_value.paginate.side_effect = botocore.exceptions.ClientError(
+            {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}},
+            'GetResources'
+        )
+        
+        rds_ops = RDSOperations('us-west-2')
+        with pytest.raises(RDSOperationError):
+            rds_ops.find_tagged_clusters('Schedule', 'enabled')
+        
+        mock_rds.list_tags_for_resource.assert_not_called()
+    
+    @patch('src.rds_operations._SESSION')
+    def test_stop_clusters_connection_error_fails_one_cluster(self, mock_session):
+        """Test that a connection error on one cluster keeps the rest of the batch's results."""
+        mock_rds, mock_tagging, paginators = make_clients(mock_session)
+        
+        def stop_db_cluster(DBClusterIdentifier):
+            if DBClusterIdentifier == 'aurora-2':
+                raise botocore.exceptions.EndpointConnectionError(endpoint_url='https://rds.us-west-2.amazonaws.com')
+            return {}
+        mock_rds.stop_db_cluster.side_effect = stop_db_cluster
+        
+        rds_ops = RDSOperations('us-west-2')
+        results = rds_ops.stop_clusters(['aurora-1', 'aurora-2', 'aurora-3'])
+        
+        assert [r['DBClusterIdentifier'] for r in results['succeeded']] == ['aurora-1', 'aurora-3']
+        assert [r['DBClusterIdentifier'] for r in results['failed']] == ['aurora-2']
+        assert results['failed'][0]['ErrorCode'] == 'EndpointConnectionError'
+        assert 'Could not connect' in results['failed'][0]['Error']
+    
+    def test_chunked(self):
+        """Test splitting identifiers into batches."""
+        chunks = list(_chunked(list(range(45)), 20))
+        
+        assert [len(chunk) for chunk in chunks] == [20, 20, 5]
+        assert [item for chunk in chunks for item in chunk] == list(range(45))
+        assert list(_chunked([], 20)) == []
+    
+    @patch('src.rds_operations._SESSION')
+    def test_verify_cluster_states_batches_describe_calls(self, mock_session):
+        """Test verification describes pending clusters in batches of VERIFY_BATCH_SIZE."""
+        mock_rds, mock_tagging, paginators = make_clients(mock_session)
+        cluster_ids = [f'aurora-{i}' for i in range(45)]
+        
+        mock_rds.describe_db_clusters.side_effect = lambda Filters: {
+            'DBClusters': [cluster(cluster_id, 'stopped') for cluster_id in Filters[0]['Values']]
+        }
+        
+        rds_ops = RDSOperations('us-west-2')
+        results = rds_ops.verify_cluster_states(cluster_ids, 'stopped', timeout=10, check_interval=1)
+        
+        # One sweep of three batches covers every cluster
+        batches = [call.kwargs['Filters'][0]['Values'] for call in mock_rds.describe_db_clusters.call_args_list]
+        assert [len(batch) for batch in batches] == [VERIFY_BATCH_SIZE, VERIFY_BATCH_SIZE, 5]
+        assert sorted(cluster_id for batch in batches for cluster_id in batch) == sorted(cluster_ids)
+        
+        assert len(results['verified']) == 45
+        assert len(results['failed']) == 0
+    
+    @patch('src.rds_operations.time.sleep')
+    @patch('src.rds_operations._SESSION')
+    def test_verify_cluster_states_polls_only_pending(self, mock_session, mock_sleep):
+        """Test that later sweeps only describe clusters still pending, with a bounded backoff."""
+        mock_rds, mock_tagging, paginators = make_clients(mock_session)
+        
+        # aurora-1 is stopped on the first sweep, aurora-2 only on the second
+        states = {'aurora-1': ['stopped'], 'aurora-2': ['stopping', 'stopped']}
+        mock_rds.describe_db_clusters.side_effect = lambda Filters: {
+            'DBClusters': [cluster(cluster_id, states[cluster_id].pop(0)) for cluster_id in Filters[0]['Values']]
+        }
+        
+        rds_ops = RDSOperations('us-west-2')
+        results = rds_ops.verify_cluster_states(['aurora-1', 'aurora-2'], 'stopped', timeout=10, check_interval=1)
+        
+        batches = [call.kwargs['Filters'][0]['Values'] for call in mock_rds.describe_db_clusters.call_args_list]
+        assert sorted(batches[0]) == ['aurora-1', 'aurora-2']
+        assert batches[1] == ['aurora-2']
+        
+        # Backoff never exceeds check_interval
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] <= 1
+        
+        assert sorted(r['DBClusterIdentifier'] for r in results['verified']) == ['aurora-1', 'aurora-2']
+        assert len(results['failed']) == 0
+    
+    @patch('src.rds_operations._SESSION')
+    def test_verify_cluster_states_error_fails_pending(self, mock_session):
+        """Test that a describe error marks every pending cluster as failed once."""
+        mock_rds, mock_tagging, paginators = make_clients(mock_session)
+        
+        mock_rds.describe_db_clusters.side_effect = botocore.exceptions.ClientError(
+            {'Error': {'Code': 'DBClusterNotFoundFault', 'Message': 'Cluster not found'}},
+            'DescribeDBClusters'
+        )
+        
+        rds_ops = RDSOperations('us-west-2')
+        results = rds_ops.verify_cluster_states(['aurora-1', 'aurora-2'], 'stopped', timeout=10, check_interval=1)
+        
+        assert len(results['verified']) == 0
+        assert [r['DBClusterIdentifier'] for r in results['failed']] == ['aurora-1', 'aurora-2']
+        assert 'Cluster not found' in results['failed'][0]['Error']
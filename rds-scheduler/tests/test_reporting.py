@@ -0,0 +1,204 @@
+# tests/test_reporting.py
+import os
+import json
+import pytest
+import tempfile
+from src.reporting import Reporter, ReportingError, _render_grid_table
+
+HEADERS = ['Account', 'Region', 'Resource Type', 'Resource ID', 'Status', 'Error']
+
+ROWS = [
+    ['production', 'us-west-2', 'Aurora Cluster', 'aurora-prod-1', 'Success', ''],
+    ['dev', 'ap-southeast-2', 'RDS Instance', 'very-long-resource-ide...', 'Failed', 'InvalidDBInstanceState: ...'],
+    ['123456789012', 'eu-west-1', 'RDS Instance', 'db', 'Simulated', '']
+]
+
+def add_results(reporter):
+    reporter.add_result(
+        account='production',
+        region='us-west-2',
+        resource_type='Aurora Cluster',
+        resource_id='aurora-prod-1',
+        previous_state='available',
+        new_state='stopping',
+        action='stop',
+        timestamp='2025-05-21T12:34:56',
+        status='Success'
+    )
+    reporter.add_result(
+        account='dev',
+        region='us-west-2',
+        resource_type='RDS Instance',
+        resource_id='db-dev-1',
+        previous_state='unknown',
+        new_state='error',
+        action='stop',
+        timestamp='2025-05-21T12:34:57',
+        status='Failed',
+        error='InvalidDBInstanceState: Instance is not available'
+    )
+
+class TestRenderGridTable:
+    
+    def test_grid_layout(self):
+        """Test the grid layout of a small table."""
+        table = _render_grid_table(['Account', 'Error'], [['prod', ''], ['development', 'x']])
+        
+        assert table == "\n".join([
+            "+-------------+---------+",
+            "| Account     | Error   |",
+            "+=============+=========+",
+            "| prod        |         |",
+            "+-------------+---------+",
+            "| development | x       |",
+            "+-------------+---------+"
+        ])
+    
+    def test_multiline_cells_are_joined(self):
+        """Test line breaks in a cell are replaced so each row stays on one line."""
+        table = _render_grid_table(['Error'], [['Throttling:\nRate exceeded']])
+        
+        assert table == "\n".join([
+            "+---------------------------+",
+            "| Error                     |",
+            "+===========================+",
+            "| Throttling: Rate exceeded |",
+            "+---------------------------+"
+        ])
+    
+    def test_matches_tabulate_grid(self):
+        """Test the table matches tabulate's grid format for single-line, non-numeric cells."""
+        tabulate = pytest.importorskip('tabulate')
+        
+        expected = tabulate.tabulate(ROWS, headers=HEADERS, tablefmt='grid')
+        assert _render_grid_table(HEADERS, ROWS) == expected
+
+class TestReporter:
+    
+    def test_add_result(self):
+        """Test adding result to the reporter."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = Reporter(tmpdir)
+            add_results(reporter)
+            
+            assert reporter.result_count == 2
+            assert reporter.results[0]['ResourceId'] == 'aurora-prod-1'
+            assert reporter.results[0]['Error'] == ''
+            assert reporter.results[1]['Status'] == 'Failed'
+    
+    def test_results_is_read_only(self):
+        """Test the results view rejects edits instead of silently dropping them."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = Reporter(tmpdir)
+            add_results(reporter)
+            results = reporter.results
+            
+            with pytest.raises(AttributeError):
+                results.append(dict(results[0]))
+            with pytest.raises(TypeError):
+                results[0]['Status'] = 'Failed'
+            
+            # The view is cached until results change
+            assert reporter.results is results
+            add_results(reporter)
+            assert len(reporter.results) == 4
+    
+    def test_extend_results(self):
+        """Test batch-adding results, including from a generator."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = Reporter(tmpdir)
+            add_results(reporter)
+            rows = reporter.results
+            
+            reporter.extend_results(row for row in rows)
+            
+            assert reporter.result_count == 4
+            assert reporter.results[2:] == rows
+    
+    def test_extend_results_missing_field_adds_nothing(self):
+        """Test that a result missing a field leaves every column unchanged."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = Reporter(tmpdir)
+            add_results(reporter)
+            rows = reporter.results
+            bad_row = dict(rows[0])
+            del bad_row['Status']
+            
+            with pytest.raises(KeyError):
+                reporter.extend_results([rows[0], bad_row])
+            
+            assert reporter.result_count == 2
+            assert reporter.results == rows
+    
+    def test_generate_csv_report(self):
+        """Test generating CSV report."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = Reporter(tmpdir)
+            add_results(reporter)
+            
+            csv_file = reporter.generate_csv_report()
+            
+            with open(csv_file, 'r') as f:
+                content = f.read()
+                assert 'Account,Region,ResourceType,ResourceId,PreviousState,NewState,Action,Timestamp,Status,Error' in content
+                assert 'production,us-west-2,Aurora Cluster,aurora-prod-1,available,stopping,stop,2025-05-21T12:34:56,Success,' in content
+                assert 'dev,us-west-2,RDS Instance,db-dev-1,unknown,error,stop,2025-05-21T12:34:57,Failed,InvalidDBInstanceState: Instance is not available' in content
+    
+    def test_generate_json_report_summary(self):
+        """Test the JSON report summary keys."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = Reporter(tmpdir)
+            add_results(reporter)
+            
+            with open(reporter.generate_json_report(), 'r') as f:
+                report = json.load(f)
+            
+            assert report['total_results'] == 2
+            assert set(report['summary']) == {
+                'total_operations', 'successful_operations', 'failed_operations',
+                'by_resource_type', 'by_action', 'by_account', 'by_region'
+            }
+            assert report['summary']['failed_operations'] == 1
+    
+    def test_empty_reports(self):
+        """Test that no report files are written without results."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = Reporter(tmpdir)
+            
+            assert reporter.generate_csv_report() is None
+            assert reporter.generate_json_report() is None
+            assert reporter.generate_html_report() is None
+            assert reporter.generate_table_report() == "No results to display"
+            assert os.listdir(tmpdir) == []
+    
+    def test_generate_table_report(self):
+        """Test the table report truncates long cells."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = Reporter(tmpdir)
+            add_results(reporter)
+            
+            table = reporter.generate_table_report()
+            
+            assert '| production ' in table
+            assert 'InvalidDBInstanceState: Ins...' in table
+            assert len(os.listdir(tmpdir)) == 1
+    
+    def test_html_and_table_reports_truncate_alike(self):
+        """Test the HTML and table reports cut long cells to the same width."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = Reporter(tmpdir)
+            add_results(reporter)
+            
+            with open(reporter.generate_html_report(), 'r') as f:
+                html = f.read()
+            table = reporter.generate_table_report()
+            
+            assert 'InvalidDBInstanceState: Ins...' in html
+            assert 'InvalidDBInstanceState: Ins...' in table
+            assert 'InvalidDBInstanceState: Inst' not in html
+    
+    def test_reports_dir_is_a_file(self):
+        """Test a reports path that is not a directory raises ReportingError."""
+        with tempfile.NamedTemporaryFile() as tmpfile:
+            with pytest.raises(ReportingError):
+                Reporter(tmpfile.name)